@@ -42,14 +42,35 @@ BLUE_ACCENT = "#3b82f6"
 # Border color - subtle lines for visual separation
 BORDER_COLOR = "#475569"
 
+# The same colors as (red, green, blue) tuples with values from 0.0 to 1.0
+# Tkinter needs the hex strings above, but matplotlib can use these tuples directly
+# without having to parse a hex string every time a chart is drawn
+# Example: THEME_RGB['GREEN_UP'] = (0.063, 0.725, 0.506)
+def _hex(s):
+    return (int(s[1:3], 16) / 255, int(s[3:5], 16) / 255, int(s[5:7], 16) / 255)
+
+THEME_RGB = {name: _hex(value) for name, value in (
+    ('BACKGROUND_COLOR', BACKGROUND_COLOR),
+    ('FRAME_BG', FRAME_BG),
+    ('CARD_BG', CARD_BG),
+    ('TEXT_COLOR', TEXT_COLOR),
+    ('SECONDARY_TEXT', SECONDARY_TEXT),
+    ('GREEN_UP', GREEN_UP),
+    ('RED_DOWN', RED_DOWN),
+    ('GRAY_NEUTRAL', GRAY_NEUTRAL),
+    ('BLUE_ACCENT', BLUE_ACCENT),
+    ('BORDER_COLOR', BORDER_COLOR),
+)}
+
 # =====================================================================================================
 # STOCK LIST - Stocks to Display in the Application
 # =====================================================================================================
 # This is the list of stock symbols that will be displayed on the main screen
 # You can add or remove stock symbols here, and they'll automatically appear in the app
 # Each symbol should be the official Yahoo Finance ticker symbol
+# It's a tuple (not a list) because it never changes while the app is running
 
-STOCKS = [
+STOCKS: tuple[str, ...] = (
     "AAPL",   # Apple Inc.
     "MSFT",   # Microsoft Corporation
     "NVDA",   # NVIDIA Corporation
@@ -65,7 +86,7 @@ STOCKS = [
     "CRM",    # Salesforce Inc.
     "ORCL",   # Oracle Corporation
     "IBM",    # International Business Machines
-]
+)
 
 # =====================================================================================================
 # UPDATE INTERVALS (in milliseconds)
@@ -82,6 +103,28 @@ PRICE_UPDATE_INTERVAL = 30000
 # 60 seconds = 60000 milliseconds (charts don't need to update as frequently)
 CHART_UPDATE_INTERVAL = 60000
 
+# =====================================================================================================
+# CACHE SETTINGS (in seconds)
+# =====================================================================================================
+# Fetched data is kept in memory for a short time so that repeated requests for the same stock
+# (e.g., opening a detail view while the grid is refreshing) don't hit Yahoo Finance again.
+# The quote TTL is slightly shorter than the price update interval above, so the cache
+# has always expired by the time the next scheduled refresh runs.
+
+# How long fetched prices and intraday chart data stay cached (20 seconds with a 30 second
+# update interval - the chart shares its download with the price, so it uses the same TTL)
+QUOTE_TTL_S = PRICE_UPDATE_INTERVAL / 1000 - 10
+
+# How long company information stays cached (24 hours - market cap, P/E, etc. change slowly)
+INFO_TTL_S = 24 * 60 * 60
+
+# Intraday chart data is also saved to disk (in the .cache folder) so it survives app restarts
+# Bars from past trading days never change, so they can be kept for a long time (90 days)
+HISTORY_FILE_TTL_S = 90 * 24 * 60 * 60
+
+# Bars from the current trading day are kept for a shorter time (7 days)
+RECENT_FILE_TTL_S = 7 * 24 * 60 * 60
+
 # =====================================================================================================
 # UI LAYOUT SETTINGS
 # =====================================================================================================
@@ -104,6 +147,10 @@ STOCK_SYMBOL_FONT_SIZE = 14
 # Font size for detail view information (in points)
 DETAIL_FONT_SIZE = 12
 
+# Most points drawn on a detail chart
+# The chart is about 1200 pixels wide (12 inches at 100 dpi), so more points can't be seen
+MAX_CHART_POINTS = 1200
+
 # =====================================================================================================
 # WINDOW DIMENSIONS
 # =====================================================================================================
@@ -114,3 +161,20 @@ WINDOW_WIDTH = 1400
 
 # Initial window height (in pixels)
 WINDOW_HEIGHT = 900
+
+# =====================================================================================================
+# PUBLIC NAMES
+# =====================================================================================================
+# The settings other files are meant to import from this module
+# (helpers starting with an underscore, like _hex, are not part of this list)
+
+__all__ = (
+    "BACKGROUND_COLOR", "FRAME_BG", "CARD_BG", "TEXT_COLOR", "SECONDARY_TEXT",
+    "GREEN_UP", "RED_DOWN", "GRAY_NEUTRAL", "BLUE_ACCENT", "BORDER_COLOR", "THEME_RGB",
+    "STOCKS",
+    "PRICE_UPDATE_INTERVAL", "CHART_UPDATE_INTERVAL",
+    "QUOTE_TTL_S", "INFO_TTL_S", "HISTORY_FILE_TTL_S", "RECENT_FILE_TTL_S",
+    "GRID_COLUMNS", "FONT_NAME", "STOCK_PRICE_FONT_SIZE", "STOCK_SYMBOL_FONT_SIZE", "DETAIL_FONT_SIZE",
+    "MAX_CHART_POINTS",
+    "WINDOW_WIDTH", "WINDOW_HEIGHT",
+)
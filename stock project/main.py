@@ -11,16 +11,231 @@
 #   - Showing detailed stock information
 # =====================================================================================================
 
+import asyncio
+import logging
+import threading
 import tkinter as tk
 from tkinter import ttk
+from tkinter import font as tkfont
+import numpy as np
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.dates import DateFormatter
-import matplotlib.pyplot as plt
+from matplotlib.dates import AutoDateLocator, DateFormatter, date2num
 
 # Import from our other files
-from constants import *  # Import all colors, settings, and stock list
+from constants import (  # Import the colors, settings, and stock list we use
+    BACKGROUND_COLOR, FRAME_BG, CARD_BG, TEXT_COLOR,
+    GREEN_UP, RED_DOWN, GRAY_NEUTRAL, BLUE_ACCENT, THEME_RGB,
+    STOCKS, PRICE_UPDATE_INTERVAL, CHART_UPDATE_INTERVAL,
+    GRID_COLUMNS, FONT_NAME, STOCK_PRICE_FONT_SIZE, STOCK_SYMBOL_FONT_SIZE, DETAIL_FONT_SIZE,
+    MAX_CHART_POINTS, WINDOW_WIDTH, WINDOW_HEIGHT,
+)
 from stock_data import StockDataManager  # Import the data fetcher class
+from stock_data import MARKET_TZ, market_session  # New York time and the market's opening hours
+
+# Messages about failed updates go to this logger instead of being printed
+logger = logging.getLogger(__name__)
+
+# =====================================================================================================
+# STOCK CARD CLASS
+# =====================================================================================================
+# A StockCard is one tile in the main grid: the stock symbol and its current price.
+# Cards are not separate widgets - each card is a rectangle and two pieces of text drawn on the
+# main view's Canvas. Changing a price is then a single itemconfig() call, with no widget layout.
+# Only the cards in rows that are scrolled into view are drawn: a card gets its canvas items
+# with attach() when its row becomes visible and gives them back with detach() when it scrolls
+# away, so the items can be reused by another card.
+# The main application keeps one StockCard per symbol in a dictionary, so after a price refresh
+# each card can be found directly by its symbol and updated with apply().
+
+class StockCard:
+    """
+    A single stock card showing a stock symbol and its current price.
+    """
+
+    # Space (in pixels) between the card's edge and its text
+    PADDING = 15
+
+    # Tag shared by the items of every card, so one set of mouse bindings covers all cards
+    TAG = "card"
+
+    # Start of each card's own tag (followed by its symbol, e.g. "card_AAPL")
+    TAG_PREFIX = "card_"
+
+    def __init__(self, canvas, symbol, symbol_font, price_font):
+        """
+        Set up the card (it's drawn later, when attach() is called).
+
+        Parameters:
+            canvas (tk.Canvas): The canvas the card is drawn on
+            symbol (str): The stock symbol (e.g., "AAPL")
+            symbol_font (tkinter.font.Font): Shared font for the symbol text
+            price_font (tkinter.font.Font): Shared font for the price text
+        """
+        self.canvas = canvas
+        self.symbol = symbol
+        self.symbol_font = symbol_font
+        self.price_font = price_font
+
+        # Every item of this card shares one tag, so the card can be found from its items
+        self.tag = f"{self.TAG_PREFIX}{symbol}"
+
+        # Height of each line of text, used to lay out the card
+        self._symbol_height = symbol_font.metrics("linespace")
+        self._price_height = price_font.metrics("linespace")
+
+        # Total card height: padding, symbol, a 10 pixel gap, price, padding
+        self.height = self.PADDING + self._symbol_height + 10 + self._price_height + self.PADDING
+
+        # The canvas item ids (background, symbol text, price text) while the card is drawn,
+        # or None while it's scrolled out of view
+        self.items = None
+
+        # What the card shows - kept here so it can be redrawn after being scrolled away
+        # The price text will be updated every 30 seconds with the new price
+        self._price_text = "Loading..."
+        self._price_color = TEXT_COLOR
+        self._position = None
+
+    def attach(self, items=None):
+        """
+        Draw the card on the canvas.
+
+        Parameters:
+            items (tuple): Canvas items (background, symbol, price) given back by another
+                           card's detach() to reuse, or None to create new ones
+        """
+        if self.items is not None:
+            return
+
+        if items is None:
+            # The card background
+            bg_id = self.canvas.create_rectangle(0, 0, 0, 0, fill=CARD_BG, outline="")
+
+            # The stock symbol text (e.g., "AAPL") and the price text
+            # The text items are disabled so the mouse "sees" only the background rectangle,
+            # which means moving over the text doesn't count as leaving the card
+            symbol_id = self.canvas.create_text(
+                0, 0, font=self.symbol_font, fill=TEXT_COLOR, anchor="n", state=tk.DISABLED
+            )
+            price_id = self.canvas.create_text(
+                0, 0, font=self.price_font, anchor="n", justify=tk.CENTER, state=tk.DISABLED
+            )
+            items = (bg_id, symbol_id, price_id)
+
+        bg_id, symbol_id, price_id = items
+        self.items = items
+
+        # Give the items the card tags (so clicks reach this card) and its texts
+        tags = (self.TAG, self.tag)
+        self.canvas.itemconfig(bg_id, tags=tags, state=tk.NORMAL)
+        self.canvas.itemconfig(symbol_id, tags=tags, text=self.symbol, state=tk.DISABLED)
+        self.canvas.itemconfig(
+            price_id, tags=tags, text=self._price_text, fill=self._price_color, state=tk.DISABLED
+        )
+
+        if self._position is not None:
+            self.place(*self._position)
+
+    def detach(self):
+        """
+        Remove the card from the canvas.
+
+        Returns:
+            tuple: The card's canvas items, hidden and untagged, ready to be reused
+        """
+        items = self.items
+        self.items = None
+        if items is not None:
+            for item in items:
+                self.canvas.itemconfig(item, tags=(), state=tk.HIDDEN)
+        return items
+
+    def place(self, x, y, width):
+        """
+        Move the card to a position on the canvas.
+
+        Parameters:
+            x (float): Left edge of the card
+            y (float): Top edge of the card
+            width (float): Width of the card
+        """
+        self._position = (x, y, width)
+        if self.items is None:
+            return
+
+        bg_id, symbol_id, price_id = self.items
+        center_x = x + width / 2
+        self.canvas.coords(bg_id, x, y, x + width, y + self.height)
+        self.canvas.coords(symbol_id, center_x, y + self.PADDING)
+        self.canvas.coords(price_id, center_x, y + self.PADDING + self._symbol_height + 10)
+
+        # Wrap long texts (like error messages) inside the card
+        self.canvas.itemconfig(price_id, width=max(1, width - 2 * self.PADDING))
+
+    def apply(self, price_data):
+        """
+        Show a new price on the card.
+
+        Parameters:
+            price_data (PriceResult): A price result from the StockDataManager
+
+        The price is colored based on whether it went up (green), down (red), or stayed same (gray).
+        """
+        # Check if there was an error
+        if price_data.error:
+            # Show error message on the card
+            self._show_price(price_data.error, TEXT_COLOR)
+            return
+
+        # Get the direction (UP, DOWN, or NEUTRAL)
+        direction = price_data.direction
+
+        # Determine the color based on direction
+        if direction == 'UP':
+            color = GREEN_UP
+        elif direction == 'DOWN':
+            color = RED_DOWN
+        else:
+            color = GRAY_NEUTRAL
+
+        # Format the price with 2 decimal places and update the card
+        self._show_price(f"${price_data.price:.2f}", color)
+
+    def _show_price(self, text, color):
+        """Remember the price text and color, and show them if the card is drawn."""
+        # Nothing to do if the card already shows this (common when the market is
+        # quiet or closed) - this skips the call into Tk completely
+        if text == self._price_text and color == self._price_color:
+            return
+
+        # The color only changes when the price direction changes, so it's
+        # only passed to Tk when it's different from the one already shown
+        changes = {'text': text}
+        if color != self._price_color:
+            changes['fill'] = color
+
+        self._price_text = text
+        self._price_color = color
+        if self.items is not None:
+            self.canvas.itemconfigure(self.items[2], **changes)
+
+
+# =====================================================================================================
+# DETAIL VIEW INFORMATION
+# =====================================================================================================
+# The pieces of information shown on the detail view, in order: (StockInfoResult field, caption)
+
+INFO_FIELDS = (
+    ('market_cap', "Market Cap"),
+    ('pe_ratio', "P/E Ratio"),
+    ('dividend_yield', "Dividend Yield"),
+    ('week_52_high', "52-Week High"),
+    ('week_52_low', "52-Week Low"),
+    ('day_high', "Day High"),
+    ('day_low', "Day Low"),
+)
+
 
 # =====================================================================================================
 # MAIN APPLICATION CLASS
@@ -56,39 +271,140 @@ class ModernStockViewer:
         self.root.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}")
         self.root.configure(bg=BACKGROUND_COLOR)
 
+        # Create the fonts once and share them between all widgets
+        # Tk then reuses the same font object instead of looking up a new one for every label
+        self.symbol_font = tkfont.Font(family=FONT_NAME, size=STOCK_SYMBOL_FONT_SIZE, weight="bold")
+        self.price_font = tkfont.Font(family=FONT_NAME, size=STOCK_PRICE_FONT_SIZE, weight="bold")
+        self.detail_font = tkfont.Font(family=FONT_NAME, size=DETAIL_FONT_SIZE)
+        self.title_font = tkfont.Font(family=FONT_NAME, size=20, weight="bold")
+        self.button_font = tkfont.Font(family=FONT_NAME, size=12, weight="bold")
+
+        # Define the look of the themed (ttk) widgets once, by style name
+        self.setup_styles()
+
         # Create a StockDataManager instance to fetch stock data
         # We'll use this throughout the app to get prices, charts, and info
         self.data_manager = StockDataManager()
 
-        # Dictionary to store label widgets for each stock
-        # We use this to update prices without recreating the labels
-        # Example: self.stock_labels['AAPL'] = the label widget for AAPL
-        self.stock_labels = {}
+        # Create an asyncio event loop that runs in its own background thread
+        # All network requests run on this loop, so the UI never freezes while waiting
+        # Results are sent back to the UI thread with root.after(0, ...)
+        self._aio_loop = asyncio.new_event_loop()
+        threading.Thread(target=self._aio_loop.run_forever, daemon=True).start()
+
+        # Close the network session cleanly when the user closes the window
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        # Dictionary to store the card for each stock
+        # We use this to update prices without recreating the cards
+        # Example: self.cards['AAPL'] = the StockCard for AAPL
+        self.cards: dict[str, StockCard] = {}
+
+        # Canvas items of cards that are scrolled out of view, ready to be reused
+        self._card_pool = []
+
+        # Whether the cards have been given their positions yet (see layout_stock_grid)
+        self._grid_laid_out = False
+
+        # ID of the grid layout waiting to run after the window stops resizing
+        # (see _schedule_layout), or None if there isn't one
+        self._layout_after_id = None
+
+        # Prices that have arrived but aren't shown yet (see apply_prices)
+        # They're all applied together in one update, instead of one update per fetch
+        self._pending = {}
+        self._flush_scheduled = False
 
-        # Dictionary to store the detail frame for each stock
-        # When the user clicks a stock, we show its detail frame
-        self.detail_frames = {}
+        # Detail data prefetches, started when the mouse rests on a card (see _on_card_enter):
+        # symbol -> the after() id of a prefetch that's waiting to start
+        self._prefetch_after = {}
+        # symbol -> the future of a prefetch that's already running
+        self._prefetches = {}
 
-        # Dictionary to store matplotlib charts for each stock
+        # The detail view (created the first time the user clicks a stock, see _ensure_detail_frame)
+        # There's only one, and it's reused for every stock: only one stock is shown at a time,
+        # and every matplotlib chart keeps a large picture of itself in memory
+        self.detail = None
+
+        # The stock the detail view is showing (None until the first stock is opened)
+        self._detail_symbol = None
+
+        # The detail view's matplotlib chart: (figure, plot, price line), and its canvas
         # We keep these in memory to update them without recreating
-        self.charts = {}
+        self.chart = None
+        self.chart_canvas = None
+
+        # The chart's blitting state: the filled area, the saved background
+        # and the axes limits the background was saved with (see _on_chart_draw)
+        self._blit = {'fill': None, 'background': None, 'limits': None}
+
+        # A fingerprint of the data currently drawn on the chart
+        # If new data has the same fingerprint, the chart doesn't need to be redrawn
+        self._last_chart_hash = None
 
-        # Dictionary to store the canvases (chart display areas)
-        self.canvases = {}
+        # The id of the scheduled chart update for the open detail view (None if there isn't one)
+        # Kept so the update can be cancelled when the user leaves the detail view
+        self._chart_after_id = None
 
         # Set up the main view (the grid of stock cards)
         self.setup_main_frame()
 
-        # Create hidden detail frames for each stock
-        # These frames are hidden until the user clicks a stock
-        self.create_detail_frames()
-
         # Show the main view first
         self.show_main_view()
 
-        # Schedule the first price update
-        # This will run every PRICE_UPDATE_INTERVAL milliseconds (e.g., 30 seconds)
-        self.update_prices()
+        # Schedule the price updates
+        # Each row of cards is refreshed every PRICE_UPDATE_INTERVAL milliseconds (e.g., 30 seconds)
+        self.start_price_updates()
+
+    # ===============================================================================================
+    # METHOD: Set Up Styles
+    # ===============================================================================================
+    def setup_styles(self):
+        """
+        Create the ttk styles used by the app's frames, labels and buttons.
+
+        Each widget then only names its style (e.g., style='Info.TLabel') instead of
+        passing its own colors and font, so Tk looks the settings up once per style.
+        """
+        style = ttk.Style(self.root)
+
+        # "clam" is a built-in theme that lets us change widget colors
+        style.theme_use('clam')
+
+        # Frames on the dark window background
+        style.configure('App.TFrame', background=BACKGROUND_COLOR)
+
+        # The detail view's top bar (slightly lighter)
+        style.configure('TopBar.TFrame', background=FRAME_BG)
+
+        # The big stock symbol in the top bar
+        style.configure(
+            'Title.TLabel',
+            background=FRAME_BG,
+            foreground=TEXT_COLOR,
+            font=self.title_font
+        )
+
+        # The lines of stock information (market cap, P/E ratio, etc.)
+        style.configure(
+            'Info.TLabel',
+            background=BACKGROUND_COLOR,
+            foreground=TEXT_COLOR,
+            font=self.detail_font
+        )
+
+        # The blue "Back to Main" button
+        style.configure(
+            'Back.TButton',
+            background=BLUE_ACCENT,
+            foreground=TEXT_COLOR,
+            font=self.button_font,
+            padding=(15, 10),
+            borderwidth=0,
+            relief=tk.FLAT
+        )
+        # Keep the button blue when the mouse is over it or it's pressed
+        style.map('Back.TButton', background=[('pressed', BLUE_ACCENT), ('active', BLUE_ACCENT)])
 
     # ===============================================================================================
     # METHOD: Set Up Main Frame
@@ -98,13 +414,13 @@ class ModernStockViewer:
         Create the main view with scrollable grid of stock cards.
 
         This method:
-        1. Creates a scrollable frame using Canvas and Scrollbar
-        2. Creates a grid layout with stock cards
+        1. Creates a scrollable Canvas with a Scrollbar
+        2. Draws a stock card on the canvas for each stock
         3. Makes it responsive so the app looks good on different screen sizes
         """
 
         # Create a frame to hold everything
-        self.main_frame = tk.Frame(self.root, bg=BACKGROUND_COLOR)
+        self.main_frame = ttk.Frame(self.root, style='App.TFrame')
         self.main_frame.pack(fill=tk.BOTH, expand=True)
 
         # Create a canvas for scrolling
@@ -118,66 +434,185 @@ class ModernStockViewer:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
         # Connect the scrollbar to the canvas
-        self.canvas.configure(yscrollcommand=scrollbar.set)
-
-        # Create a frame inside the canvas to hold the stock cards
-        # This frame will scroll when the user scrolls the canvas
-        self.scrollable_frame = tk.Frame(self.canvas, bg=BACKGROUND_COLOR)
-        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-
-        # When the scrollable frame changes size, update the canvas scroll region
-        # This ensures the scrollbar works correctly
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
+        # Every time the canvas scrolls, also draw the cards that scrolled into view
+        def _on_scroll(first, last):
+            scrollbar.set(first, last)
+            self.update_visible_cards()
+
+        self.canvas.configure(yscrollcommand=_on_scroll)
+
+        # The stock cards are drawn directly on the canvas
+        # Whenever the canvas changes size, the cards are laid out again to fill its width
+        self.canvas.bind("<Configure>", lambda e: self._schedule_layout(e.width))
 
         # Allow mouse wheel scrolling
         # This is a nice user experience feature
-        def _on_mousewheel(event):
-            self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-
-        self.canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        self._bind_mousewheel(self.canvas)
 
         # Create the stock card grid
         self.create_stock_grid()
 
+    # ===============================================================================================
+    # METHOD: Bind Mouse Wheel
+    # ===============================================================================================
+    def _bind_mousewheel(self, canvas):
+        """
+        Scroll a canvas with the mouse wheel while the mouse is over it.
+
+        Parameters:
+            canvas (tk.Canvas): The scrollable canvas
+
+        The wheel handler is only installed while the mouse is inside the canvas,
+        so each wheel turn scrolls just the canvas under the mouse.
+        """
+        def _on_mousewheel(event):
+            canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+
+        def _on_enter(event):
+            canvas.bind_all("<MouseWheel>", _on_mousewheel)
+
+        def _on_leave(event):
+            # Moving onto a widget inside the canvas (like the detail view's chart)
+            # also counts as leaving it, so only unbind if the mouse really left
+            widget = canvas.winfo_containing(event.x_root, event.y_root)
+            if widget is None or not str(widget).startswith(str(canvas)):
+                canvas.unbind_all("<MouseWheel>")
+
+        canvas.bind("<Enter>", _on_enter)
+        canvas.bind("<Leave>", _on_leave)
+
     # ===============================================================================================
     # METHOD: Create Stock Card Grid
     # ===============================================================================================
     def create_stock_grid(self):
         """
-        Create a grid of stock cards arranged in columns.
+        Create a stock card for each stock.
 
-        This method:
-        1. Creates rows and columns in the scrollable frame
-        2. Creates a card for each stock
-        3. Arranges them so they look nice (3 columns)
+        The cards are positioned in rows and columns later by layout_stock_grid(),
+        once the canvas knows its width.
         """
 
         # Loop through each stock in the stock list
-        for idx, stock in enumerate(STOCKS):
+        for stock in STOCKS:
+            # Create a card for this stock
+            self.create_stock_card(stock)
+
+        # Make the cards clickable
+        # These bindings are shared by all cards (every card's items carry StockCard.TAG),
+        # and the handlers find out which card the mouse is on
+        # When the user clicks on any part of a card, show the detail view for that stock
+        self.canvas.tag_bind(StockCard.TAG, "<Button-1>", self._on_card_click)
+        # Change cursor to hand when hovering over a card (shows it's clickable)
+        self.canvas.tag_bind(StockCard.TAG, "<Enter>", self._on_card_enter)
+        self.canvas.tag_bind(StockCard.TAG, "<Leave>", self._on_card_leave)
+
+    # ===============================================================================================
+    # METHOD: Schedule Grid Layout
+    # ===============================================================================================
+    def _schedule_layout(self, width):
+        """
+        Lay out the card grid once the canvas has stopped changing size.
+
+        Parameters:
+            width (int): The new width of the canvas (in pixels)
+
+        Resizing the window sends many <Configure> events in a row. Each one cancels
+        the layout scheduled by the one before, so the grid is laid out only once,
+        50 milliseconds after the last change.
+        """
+        if self._layout_after_id is not None:
+            self.root.after_cancel(self._layout_after_id)
+        self._layout_after_id = self.root.after(50, self._run_layout, width)
+
+    def _run_layout(self, width):
+        """Run the layout scheduled by _schedule_layout()."""
+        self._layout_after_id = None
+        self.layout_stock_grid(width)
+
+    # ===============================================================================================
+    # METHOD: Lay Out the Stock Card Grid
+    # ===============================================================================================
+    def layout_stock_grid(self, width):
+        """
+        Arrange the stock cards in a grid of GRID_COLUMNS columns that fills the canvas width.
+
+        Parameters:
+            width (int): The current width of the canvas (in pixels)
+        """
+        # Space around each card (in pixels)
+        margin = 15
+
+        # Split the width evenly between the columns
+        cell_width = width / GRID_COLUMNS
+        card_width = max(1, cell_width - 2 * margin)
+        card_height = max((card.height for card in self.cards.values()), default=0)
+        cell_height = card_height + 2 * margin
+
+        for idx, symbol in enumerate(STOCKS):
             # Calculate which row and column this stock should be in
             # idx = 0, 1, 2 -> row 0 (first three stocks in first row)
             # idx = 3, 4, 5 -> row 1 (next three stocks in second row)
             # etc.
             row = idx // GRID_COLUMNS
             col = idx % GRID_COLUMNS
+            self.cards[symbol].place(col * cell_width + margin, row * cell_height + margin, card_width)
 
-            # Create a card for this stock
-            self.create_stock_card(stock, row, col)
+        # Update the canvas scroll region so the scrollbar covers every row
+        total_rows = (len(STOCKS) + GRID_COLUMNS - 1) // GRID_COLUMNS
+        self.canvas.configure(scrollregion=(0, 0, width, total_rows * cell_height))
+
+        # Draw the cards that are now in view
+        self._grid_laid_out = True
+        self.update_visible_cards()
+
+    # ===============================================================================================
+    # METHOD: Update Visible Cards
+    # ===============================================================================================
+    def update_visible_cards(self):
+        """
+        Draw only the cards in rows that are (nearly) scrolled into view.
+
+        Cards in rows far outside the view give their canvas items back to a pool
+        (self._card_pool), and cards coming into view reuse items from that pool.
+        This keeps the number of canvas items small even with a very long STOCKS list.
+        """
+        # Nothing to draw until the cards know where they go
+        if not self._grid_laid_out:
+            return
+
+        total_rows = (len(STOCKS) + GRID_COLUMNS - 1) // GRID_COLUMNS
+
+        # yview() gives the visible part of the scroll region as fractions (0.0 to 1.0)
+        # One extra row above and below is drawn so scrolling never shows a gap
+        top, bottom = self.canvas.yview()
+        first_row = int(top * total_rows) - 1
+        last_row = int(bottom * total_rows) + 1
+
+        visible = set()
+        for idx, symbol in enumerate(STOCKS):
+            if first_row <= idx // GRID_COLUMNS <= last_row:
+                visible.add(symbol)
+
+        # First free the items of cards that left the view...
+        for symbol, card in self.cards.items():
+            if symbol not in visible and card.items is not None:
+                self._card_pool.append(card.detach())
+
+        # ...then draw the cards in view, reusing freed items where possible
+        for symbol in visible:
+            card = self.cards[symbol]
+            if card.items is None:
+                card.attach(self._card_pool.pop() if self._card_pool else None)
 
     # ===============================================================================================
     # METHOD: Create a Single Stock Card
     # ===============================================================================================
-    def create_stock_card(self, symbol, row, col):
+    def create_stock_card(self, symbol):
         """
         Create a single stock card with price display.
 
         Parameters:
             symbol (str): The stock symbol (e.g., "AAPL")
-            row (int): The row position in the grid
-            col (int): The column position in the grid
 
         This method creates a card that shows:
         - Stock symbol (e.g., "AAPL")
@@ -186,45 +621,97 @@ class ModernStockViewer:
         - Clickable so user can see details
         """
 
-        # Create a frame for the card
-        # This frame will hold the symbol and price labels
-        card_frame = tk.Frame(self.scrollable_frame, bg=CARD_BG, relief=tk.FLAT)
-        card_frame.grid(row=row, column=col, padx=15, pady=15, sticky="nsew")
+        # Create the card and remember it so its price can be updated later
+        self.cards[symbol] = StockCard(
+            self.canvas,
+            symbol,
+            symbol_font=self.symbol_font,
+            price_font=self.price_font
+        )
 
-        # Make the card expand to fill available space
-        self.scrollable_frame.grid_columnconfigure(col, weight=1)
+    # ===============================================================================================
+    # METHOD: Find the Card Under the Mouse
+    # ===============================================================================================
+    def _card_symbol(self):
+        """
+        Get the symbol of the card the mouse is on.
 
-        # Create the stock symbol label (e.g., "AAPL")
-        symbol_label = tk.Label(
-            card_frame,
-            text=symbol,
-            font=(FONT_NAME, STOCK_SYMBOL_FONT_SIZE, "bold"),
-            bg=CARD_BG,
-            fg=TEXT_COLOR
-        )
-        symbol_label.pack(pady=(15, 5))
-
-        # Create the price label (this will be updated later)
-        # We'll update this label every 30 seconds with the new price
-        price_label = tk.Label(
-            card_frame,
-            text="Loading...",
-            font=(FONT_NAME, STOCK_PRICE_FONT_SIZE, "bold"),
-            bg=CARD_BG,
-            fg=TEXT_COLOR
-        )
-        price_label.pack(pady=(5, 15))
+        Returns:
+            str: The stock symbol, or None if the mouse isn't on a card
+
+        Tk calls the canvas item under the mouse "current", and its tags say which card it's part of.
+        """
+        for tag in self.canvas.gettags(tk.CURRENT):
+            if tag.startswith(StockCard.TAG_PREFIX):
+                return tag[len(StockCard.TAG_PREFIX):]
+        return None
+
+    # ===============================================================================================
+    # METHOD: Stock Card Clicked
+    # ===============================================================================================
+    def _on_card_click(self, event):
+        """Show the detail view for the clicked card's stock."""
+        symbol = self._card_symbol()
+        if symbol is not None:
+            self.show_detail_view(symbol)
+
+    # ===============================================================================================
+    # METHOD: Mouse Enters a Stock Card
+    # ===============================================================================================
+    def _on_card_enter(self, event):
+        """
+        Show the hand cursor and, if the mouse stays on the card for 150ms, start loading
+        the stock's chart and information in the background.
+
+        If the user then clicks the card, the detail view finds the chart data and
+        information already in the StockDataManager's caches and opens without waiting.
+        Waiting a moment first means moving the mouse across the grid doesn't start
+        a request for every card it passes over.
+        """
+        self._set_cursor_hand(event)
+
+        symbol = self._card_symbol()
+        if symbol is None or symbol in self._prefetch_after:
+            return
+
+        self._prefetch_after[symbol] = self.root.after(150, lambda: self._start_prefetch(symbol))
 
-        # Store the price label in our dictionary so we can update it later
-        self.stock_labels[symbol] = price_label
+    # ===============================================================================================
+    # METHOD: Start Prefetching a Stock's Detail Data
+    # ===============================================================================================
+    def _start_prefetch(self, symbol):
+        """
+        Start loading a stock's chart and information on the background event loop.
 
-        # Make the card clickable
-        # When the user clicks on any part of the card, show the detail view for that stock
-        for widget in [card_frame, symbol_label, price_label]:
-            widget.bind("<Button-1>", lambda e, s=symbol: self.show_detail_view(s))
-            # Change cursor to hand when hovering over card (shows it's clickable)
-            widget.bind("<Enter>", lambda e: self._set_cursor_hand(e))
-            widget.bind("<Leave>", lambda e: self._set_cursor_arrow(e))
+        Parameters:
+            symbol (str): The stock symbol the mouse is resting on
+        """
+        self._prefetch_after.pop(symbol, None)
+
+        # Only start one prefetch per stock at a time
+        pending = self._prefetches.get(symbol)
+        if pending is None or pending.done():
+            self._prefetches[symbol] = asyncio.run_coroutine_threadsafe(
+                self.data_manager.prefetch(symbol), self._aio_loop
+            )
+
+    # ===============================================================================================
+    # METHOD: Mouse Leaves a Stock Card
+    # ===============================================================================================
+    def _on_card_leave(self, event):
+        """
+        Restore the arrow cursor and cancel the stock's prefetch if it hasn't started yet.
+
+        This stops quick mouse movements across the grid from starting a burst of requests.
+        A prefetch that has already started is left to finish: its downloads are already
+        running in a worker thread, and their results still fill the caches.
+        """
+        self._set_cursor_arrow(event)
+
+        # While Tk handles <Leave>, "current" is still the card being left
+        after_id = self._prefetch_after.pop(self._card_symbol(), None)
+        if after_id is not None:
+            self.root.after_cancel(after_id)
 
     # ===============================================================================================
     # METHOD: Change Cursor to Hand (for hovering)
@@ -241,200 +728,191 @@ class ModernStockViewer:
         event.widget.config(cursor="arrow")
 
     # ===============================================================================================
-    # METHOD: Create Detail Frames for Each Stock
+    # METHOD: Create the Detail Frame (on first use)
     # ===============================================================================================
-    def create_detail_frames(self):
+    def _ensure_detail_frame(self):
         """
-        Create hidden detail frames for each stock.
+        Create the detail frame, the first time it's needed.
 
         When the user clicks a stock card, we show the detail frame for that stock.
         The detail frame shows:
         - A larger chart of the stock price
         - Detailed information (market cap, P/E ratio, etc.)
         - A back button to return to the main view
+
+        Building the frame (especially its matplotlib chart) is slow, so it isn't created
+        at startup but when the first stock is opened. After that the same frame is shown
+        for every stock, and _show_stock() just switches what it shows.
         """
+        # Already created - nothing to do
+        if self.detail is not None:
+            return
+
+        # Create a frame for the stock's details
+        detail_frame = ttk.Frame(self.root, style='App.TFrame')
+        detail_frame.place(relwidth=1, relheight=1)  # Make it fill the entire window
+
+        # Create a top bar for the stock symbol and back button
+        top_bar = ttk.Frame(detail_frame, style='TopBar.TFrame', height=60)
+        top_bar.pack(fill=tk.X)
+
+        # Back button
+        back_button = ttk.Button(
+            top_bar,
+            text="← Back to Main",
+            style='Back.TButton',
+            command=self.show_main_view
+        )
+        back_button.pack(side=tk.LEFT, padx=15, pady=10)
 
-        # Loop through each stock
-        for symbol in STOCKS:
-            # Create a frame for this stock's details
-            detail_frame = tk.Frame(self.root, bg=BACKGROUND_COLOR)
-            detail_frame.place(relwidth=1, relheight=1)  # Make it fill the entire window
-
-            # Create a top bar for the stock symbol and back button
-            top_bar = tk.Frame(detail_frame, bg=FRAME_BG, height=60)
-            top_bar.pack(fill=tk.X)
-
-            # Back button
-            back_button = tk.Button(
-                top_bar,
-                text="← Back to Main",
-                font=(FONT_NAME, 12, "bold"),
-                bg=BLUE_ACCENT,
-                fg=TEXT_COLOR,
-                relief=tk.FLAT,
-                padx=15,
-                pady=10,
-                command=self.show_main_view
-            )
-            back_button.pack(side=tk.LEFT, padx=15, pady=10)
-
-            # Stock symbol label
-            symbol_label = tk.Label(
-                top_bar,
-                text=symbol,
-                font=(FONT_NAME, 20, "bold"),
-                bg=FRAME_BG,
-                fg=TEXT_COLOR
-            )
-            symbol_label.pack(side=tk.LEFT, padx=15, pady=10)
-
-            # Create a scrollable area for content below the top bar
-            content_frame = tk.Frame(detail_frame, bg=BACKGROUND_COLOR)
-            content_frame.pack(fill=tk.BOTH, expand=True)
-
-            # Create a canvas for scrolling
-            canvas = tk.Canvas(content_frame, bg=BACKGROUND_COLOR, highlightthickness=0)
-            canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-
-            # Add scrollbar
-            scrollbar = ttk.Scrollbar(content_frame, orient=tk.VERTICAL, command=canvas.yview)
-            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-            canvas.configure(yscrollcommand=scrollbar.set)
-
-            # Create a frame inside the canvas to hold the chart and info
-            inner_frame = tk.Frame(canvas, bg=BACKGROUND_COLOR)
-            canvas.create_window((0, 0), window=inner_frame, anchor="nw")
-
-            def configure_scroll(event):
-                canvas.configure(scrollregion=canvas.bbox("all"))
-
-            inner_frame.bind("<Configure>", configure_scroll)
-
-            # Create a frame for the chart
-            chart_frame = tk.Frame(inner_frame, bg=BACKGROUND_COLOR)
-            chart_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-
-            # Create a matplotlib figure for the chart
-            # figsize=(12, 4) means the chart will be 12 inches wide and 4 inches tall
-            # dpi=100 means 100 dots per inch (higher = more detailed)
-            fig = Figure(figsize=(12, 4), dpi=100)
-            plot = fig.add_subplot(1, 1, 1)
-
-            # Style the plot to match our dark theme
-            fig.patch.set_facecolor(BACKGROUND_COLOR)
-            plot.set_facecolor(FRAME_BG)
-            plot.tick_params(colors=SECONDARY_TEXT)
-            plot.spines['bottom'].set_color(BORDER_COLOR)
-            plot.spines['left'].set_color(BORDER_COLOR)
-            plot.spines['top'].set_visible(False)
-            plot.spines['right'].set_visible(False)
-
-            # Create a canvas to display the matplotlib figure
-            canvas_widget = FigureCanvasTkAgg(fig, master=chart_frame)
-            canvas_widget.draw()
-            canvas_widget.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-
-            # Store the chart and canvas for later updates
-            self.charts[symbol] = (fig, plot)
-            self.canvases[symbol] = canvas_widget
-
-            # Create a frame for stock information
-            info_frame = tk.Frame(inner_frame, bg=BACKGROUND_COLOR)
-            info_frame.pack(fill=tk.BOTH, padx=20, pady=20)
-
-            # Create labels for each piece of information
-            # These will be updated when we show the detail view
-            info_labels = {}
-
-            # Market Cap label
-            market_cap_label = tk.Label(
-                info_frame,
-                text="Market Cap: Loading...",
-                font=(FONT_NAME, DETAIL_FONT_SIZE),
-                bg=BACKGROUND_COLOR,
-                fg=TEXT_COLOR,
-                justify=tk.LEFT
-            )
-            market_cap_label.pack(anchor="w", pady=5)
-            info_labels['market_cap'] = market_cap_label
-
-            # P/E Ratio label
-            pe_label = tk.Label(
-                info_frame,
-                text="P/E Ratio: Loading...",
-                font=(FONT_NAME, DETAIL_FONT_SIZE),
-                bg=BACKGROUND_COLOR,
-                fg=TEXT_COLOR,
-                justify=tk.LEFT
-            )
-            pe_label.pack(anchor="w", pady=5)
-            info_labels['pe_ratio'] = pe_label
-
-            # Dividend Yield label
-            div_label = tk.Label(
-                info_frame,
-                text="Dividend Yield: Loading...",
-                font=(FONT_NAME, DETAIL_FONT_SIZE),
-                bg=BACKGROUND_COLOR,
-                fg=TEXT_COLOR,
-                justify=tk.LEFT
-            )
-            div_label.pack(anchor="w", pady=5)
-            info_labels['dividend_yield'] = div_label
-
-            # 52-Week High label
-            high_52_label = tk.Label(
-                info_frame,
-                text="52-Week High: Loading...",
-                font=(FONT_NAME, DETAIL_FONT_SIZE),
-                bg=BACKGROUND_COLOR,
-                fg=TEXT_COLOR,
-                justify=tk.LEFT
-            )
-            high_52_label.pack(anchor="w", pady=5)
-            info_labels['52_week_high'] = high_52_label
-
-            # 52-Week Low label
-            low_52_label = tk.Label(
-                info_frame,
-                text="52-Week Low: Loading...",
-                font=(FONT_NAME, DETAIL_FONT_SIZE),
-                bg=BACKGROUND_COLOR,
-                fg=TEXT_COLOR,
-                justify=tk.LEFT
-            )
-            low_52_label.pack(anchor="w", pady=5)
-            info_labels['52_week_low'] = low_52_label
-
-            # Day High label
-            day_high_label = tk.Label(
-                info_frame,
-                text="Day High: Loading...",
-                font=(FONT_NAME, DETAIL_FONT_SIZE),
-                bg=BACKGROUND_COLOR,
-                fg=TEXT_COLOR,
-                justify=tk.LEFT
-            )
-            day_high_label.pack(anchor="w", pady=5)
-            info_labels['day_high'] = day_high_label
-
-            # Day Low label
-            day_low_label = tk.Label(
-                info_frame,
-                text="Day Low: Loading...",
-                font=(FONT_NAME, DETAIL_FONT_SIZE),
-                bg=BACKGROUND_COLOR,
-                fg=TEXT_COLOR,
-                justify=tk.LEFT
-            )
-            day_low_label.pack(anchor="w", pady=5)
-            info_labels['day_low'] = day_low_label
+        # Stock symbol label (the symbol is filled in by _show_stock)
+        symbol_label = ttk.Label(top_bar, style='Title.TLabel')
+        symbol_label.pack(side=tk.LEFT, padx=15, pady=10)
 
-            # Store the detail frame and info labels
-            self.detail_frames[symbol] = {
-                'frame': detail_frame,
-                'info_labels': info_labels
-            }
+        # Create a scrollable area for content below the top bar
+        content_frame = ttk.Frame(detail_frame, style='App.TFrame')
+        content_frame.pack(fill=tk.BOTH, expand=True)
+
+        # Create a canvas for scrolling
+        canvas = tk.Canvas(content_frame, bg=BACKGROUND_COLOR, highlightthickness=0)
+        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        # Add scrollbar
+        scrollbar = ttk.Scrollbar(content_frame, orient=tk.VERTICAL, command=canvas.yview)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        canvas.configure(yscrollcommand=scrollbar.set)
+
+        # Create a frame inside the canvas to hold the chart and info
+        inner_frame = ttk.Frame(canvas, style='App.TFrame')
+        canvas.create_window((0, 0), window=inner_frame, anchor="nw")
+
+        # The scroll region is updated once the frame stops changing size
+        # (while the frame is being built or resized it changes many times in a row)
+        scroll_after = {'id': None}
+
+        def update_scrollregion():
+            scroll_after['id'] = None
+            canvas.configure(scrollregion=canvas.bbox("all"))
+
+        def configure_scroll(event):
+            if scroll_after['id'] is not None:
+                self.root.after_cancel(scroll_after['id'])
+            scroll_after['id'] = self.root.after(50, update_scrollregion)
+
+        inner_frame.bind("<Configure>", configure_scroll)
+
+        # Allow mouse wheel scrolling of the detail view
+        self._bind_mousewheel(canvas)
+
+        # Create a frame for the chart
+        chart_frame = ttk.Frame(inner_frame, style='App.TFrame')
+        chart_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+
+        # Create a matplotlib figure for the chart
+        # figsize=(12, 4) means the chart will be 12 inches wide and 4 inches tall
+        # dpi=100 means 100 dots per inch (higher = more detailed)
+        fig = Figure(figsize=(12, 4), dpi=100)
+        plot = fig.add_subplot(1, 1, 1)
+
+        # Style the plot to match our dark theme
+        # (matplotlib gets the colors as ready-made RGB tuples from THEME_RGB)
+        fig.patch.set_facecolor(THEME_RGB['BACKGROUND_COLOR'])
+        plot.set_facecolor(THEME_RGB['FRAME_BG'])
+        plot.tick_params(colors=THEME_RGB['SECONDARY_TEXT'])
+        plot.spines['bottom'].set_color(THEME_RGB['BORDER_COLOR'])
+        plot.spines['left'].set_color(THEME_RGB['BORDER_COLOR'])
+        plot.spines['top'].set_visible(False)
+        plot.spines['right'].set_visible(False)
+
+        # Create the price line once, empty (update_chart only gives it new data)
+        # It's "animated", which means a normal draw skips it: it's drawn separately
+        # on top of a saved picture of the rest of the chart (see _on_chart_draw)
+        line, = plot.plot([], [], color=THEME_RGB['BLUE_ACCENT'], linewidth=2, animated=True)
+
+        # Set the labels
+        plot.set_xlabel("Time", color=THEME_RGB['SECONDARY_TEXT'])
+        plot.set_ylabel("Price ($)", color=THEME_RGB['SECONDARY_TEXT'])
+
+        # Format the x-axis to show times (not dates)
+        # DateFormatter('%H:%M') means show hours and minutes (e.g., "09:30")
+        # The times are shown in New York time, like the market's opening hours
+        plot.xaxis.set_major_locator(AutoDateLocator(tz=MARKET_TZ))
+        plot.xaxis.set_major_formatter(DateFormatter('%H:%M', tz=MARKET_TZ))
+
+        # Rotate the x-axis labels so they're readable
+        fig.autofmt_xdate(rotation=45)
+
+        # Add a grid for easier reading
+        plot.grid(True, alpha=0.2, color=THEME_RGB['BORDER_COLOR'])
+
+        # Store the chart for later updates
+        self.chart = (fig, plot, line)
+
+        # Create a canvas to display the matplotlib figure
+        canvas_widget = FigureCanvasTkAgg(fig, master=chart_frame)
+        self.chart_canvas = canvas_widget
+
+        # Whenever the whole chart is drawn (first time, new axes, window resized),
+        # save the new background and draw the line on top of it
+        canvas_widget.mpl_connect('draw_event', lambda e: self._on_chart_draw())
+
+        canvas_widget.draw_idle()
+        canvas_widget.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+        # Create a frame for stock information
+        info_frame = ttk.Frame(inner_frame, style='App.TFrame')
+        info_frame.pack(fill=tk.BOTH, padx=20, pady=20)
+
+        # Create one label for all the information, one line per piece of information
+        # It will be updated when we show the detail view - a single update for all the lines
+        info_label = ttk.Label(info_frame, text=self._format_info(None), style='Info.TLabel', justify=tk.LEFT)
+        info_label.pack(anchor="w", pady=5)
+
+        # Stop the chart updates if the detail frame is ever destroyed
+        detail_frame.bind("<Destroy>", lambda e: self._cancel_chart_refresh())
+
+        # Store the detail frame, its title and info labels
+        self.detail = {
+            'frame': detail_frame,
+            'title': symbol_label,
+            'info_label': info_label
+        }
+
+    # ===============================================================================================
+    # METHOD: Switch the Detail Frame to a Stock
+    # ===============================================================================================
+    def _show_stock(self, symbol):
+        """
+        Make the detail frame show a stock, if it's showing a different one.
+
+        Parameters:
+            symbol (str): The stock symbol to show
+
+        The title changes to the new stock, and the chart and info labels are
+        emptied until the new stock's data arrives.
+        """
+        if self._detail_symbol == symbol:
+            return
+        self._detail_symbol = symbol
+
+        # Show the new stock's symbol
+        self.detail['title'].config(text=symbol)
+
+        # Show "Loading..." until the information arrives
+        self.detail['info_label'].config(text=self._format_info(None))
+
+        # Set the chart title and take the previous stock's prices off the chart
+        fig, plot, line = self.chart
+        plot.set_title(f"{symbol} - Intraday Prices", color=THEME_RGB['TEXT_COLOR'], fontsize=14, fontweight='bold')
+        line.set_data([], [])
+        if self._blit['fill'] is not None:
+            self._blit['fill'].remove()
+            self._blit['fill'] = None
+
+        # The saved background still has the old title, so the next update must draw everything
+        self._blit['background'] = None
+        self._last_chart_hash = None
+        self.chart_canvas.draw_idle()
 
     # ===============================================================================================
     # METHOD: Show Main View
@@ -445,9 +923,12 @@ class ModernStockViewer:
 
         This method hides all detail frames and shows the main frame.
         """
-        # Hide all detail frames
-        for symbol in STOCKS:
-            self.detail_frames[symbol]['frame'].place_forget()
+        # Stop the chart updates of the detail view we're leaving
+        self._cancel_chart_refresh()
+
+        # Hide the detail frame (if it has been created)
+        if self.detail is not None:
+            self.detail['frame'].place_forget()
 
         # Show the main frame
         self.main_frame.pack(fill=tk.BOTH, expand=True)
@@ -467,17 +948,56 @@ class ModernStockViewer:
         2. Updates the chart with current data
         3. Updates the information labels
         """
+        # Only the visible stock's chart should keep updating, so stop any
+        # chart updates that are still scheduled for a previously opened stock
+        self._cancel_chart_refresh()
+
         # Hide the main frame
         self.main_frame.pack_forget()
 
+        # Create the detail frame if no stock has been opened before
+        self._ensure_detail_frame()
+
         # Show the detail frame for this stock
-        self.detail_frames[symbol]['frame'].place(relwidth=1, relheight=1)
+        self._show_stock(symbol)
+        self.detail['frame'].place(relwidth=1, relheight=1)
 
         # Update the chart and information
         self.update_detail_view(symbol)
 
         # Schedule the chart to update every CHART_UPDATE_INTERVAL milliseconds
-        self.root.after(CHART_UPDATE_INTERVAL, lambda: self.update_chart(symbol))
+        self._chart_after_id = self.root.after(CHART_UPDATE_INTERVAL, self._refresh_chart, symbol)
+
+    # ===============================================================================================
+    # METHOD: Refresh Chart (repeating)
+    # ===============================================================================================
+    def _refresh_chart(self, symbol):
+        """
+        Update the chart of the open detail view and schedule the next update.
+
+        Parameters:
+            symbol (str): The stock symbol whose detail view is open
+
+        The updates stop as soon as the detail view is no longer visible,
+        so no data is downloaded for charts nobody is looking at.
+        """
+        self._chart_after_id = None
+
+        frame = self.detail['frame']
+        if self._detail_symbol != symbol or not frame.winfo_exists() or not frame.winfo_ismapped():
+            return
+
+        self.update_chart(symbol)
+        self._chart_after_id = self.root.after(CHART_UPDATE_INTERVAL, self._refresh_chart, symbol)
+
+    # ===============================================================================================
+    # METHOD: Cancel Chart Refresh
+    # ===============================================================================================
+    def _cancel_chart_refresh(self):
+        """Cancel the scheduled chart update (if there is one)."""
+        if self._chart_after_id is not None:
+            self.root.after_cancel(self._chart_after_id)
+            self._chart_after_id = None
 
     # ===============================================================================================
     # METHOD: Update Detail View
@@ -488,145 +1008,316 @@ class ModernStockViewer:
 
         Parameters:
             symbol (str): The stock symbol to update
+
+        Both downloads run on the background event loop, so opening a stock
+        never freezes the window while waiting for the network.
         """
         # Update the chart
         self.update_chart(symbol)
 
-        # Fetch stock information using the StockDataManager
-        info = self.data_manager.get_stock_info(symbol)
+        # Fetch stock information using the StockDataManager (this does NOT block)
+        future = asyncio.run_coroutine_threadsafe(self.data_manager.fetch_info(symbol), self._aio_loop)
 
-        # Update each information label with the fetched data
-        info_labels = self.detail_frames[symbol]['info_labels']
+        # When the information arrives, show it on the UI thread
+        future.add_done_callback(lambda f: self.root.after(0, self.apply_info, symbol, f))
 
-        info_labels['market_cap'].config(text=f"Market Cap: {info['market_cap']}")
-        info_labels['pe_ratio'].config(text=f"P/E Ratio: {info['pe_ratio']}")
-        info_labels['dividend_yield'].config(text=f"Dividend Yield: {info['dividend_yield']}")
-        info_labels['52_week_high'].config(text=f"52-Week High: {info['52_week_high']}")
-        info_labels['52_week_low'].config(text=f"52-Week Low: {info['52_week_low']}")
-        info_labels['day_high'].config(text=f"Day High: {info['day_high']}")
-        info_labels['day_low'].config(text=f"Day Low: {info['day_low']}")
+    # ===============================================================================================
+    # METHOD: Apply Stock Information
+    # ===============================================================================================
+    def apply_info(self, symbol, future):
+        """
+        Show the result of a finished information fetch on the detail view.
+
+        Parameters:
+            symbol (str): The stock symbol the information is for
+            future: The finished future returned for StockDataManager.fetch_info()
+        """
+        try:
+            info = future.result()
+        except Exception as e:
+            logger.warning("Error updating info for %s: %s", symbol, e)
+            return
+
+        # The user may have opened a different stock while this was downloading
+        if symbol != self._detail_symbol:
+            return
+
+        # Update the information label with the fetched data (one update for every line)
+        self.detail['info_label'].config(text=self._format_info(info))
+
+    # ===============================================================================================
+    # METHOD: Format Stock Information
+    # ===============================================================================================
+    def _format_info(self, info):
+        """
+        Build the text of the information label, one line per piece of information.
+
+        Parameters:
+            info (StockInfoResult): A result of StockDataManager.get_stock_info(),
+                                    or None to show "Loading..." on every line
+
+        Returns:
+            str: The lines, e.g. "Market Cap: $2.80T" on the first one
+        """
+        return "\n".join(
+            f"{caption}: {getattr(info, key) if info is not None else 'Loading...'}"
+            for key, caption in INFO_FIELDS
+        )
 
     # ===============================================================================================
     # METHOD: Update Chart
     # ===============================================================================================
     def update_chart(self, symbol):
         """
-        Update the intraday chart for a stock.
+        Start an update of the intraday chart for a stock.
 
         Parameters:
             symbol (str): The stock symbol to update the chart for
 
+        The data is downloaded on the background event loop and drawn by
+        apply_chart() on the UI thread once it arrives.
+        """
+        # Fetch intraday data using the StockDataManager (this does NOT block)
+        future = asyncio.run_coroutine_threadsafe(self.data_manager.fetch_intraday(symbol), self._aio_loop)
+
+        # When the data arrives, draw it on the UI thread
+        future.add_done_callback(lambda f: self.root.after(0, self.apply_chart, symbol, f))
+
+    # ===============================================================================================
+    # METHOD: Apply Chart Data
+    # ===============================================================================================
+    def apply_chart(self, symbol, future):
+        """
+        Draw the result of a finished intraday data fetch on the stock's chart.
+
+        Parameters:
+            symbol (str): The stock symbol the data is for
+            future: The finished future returned for StockDataManager.fetch_intraday()
+
         This method:
-        1. Fetches the latest intraday data
-        2. Clears the old chart
-        3. Plots the new data
-        4. Refreshes the canvas to show the new chart
+        1. Gets the downloaded data (and stops if it's the same as last time)
+        2. Downsamples it to match the width of the chart
+        3. Puts the new data on the chart's line
+        4. Redraws only the line on top of the saved background ("blitting"),
+           or the whole chart if the axes had to change (a new day or price range)
         """
         try:
-            # Fetch intraday data using the StockDataManager
-            data = self.data_manager.get_intraday_data(symbol)
+            # Get the intraday data the StockDataManager downloaded
+            data = future.result()
 
-            # Check if we got valid data
-            if data is None or data.empty:
+            # Check if we got valid data, for the stock that's still being shown
+            # (the user may have opened a different stock while this was downloading)
+            if data is None or data.empty or symbol != self._detail_symbol:
                 return
 
-            # Get the chart figure and plot
-            fig, plot = self.charts[symbol]
-
-            # Clear the old chart
-            plot.clear()
+            # Skip the redraw if the data hasn't changed since the chart was last drawn
+            # (common outside market hours, or when the data came from the cache)
+            # The number of minutes, the last timestamp and the last price identify the data
+            data_hash = hash((len(data), data.index[-1].value, float(data['Close'].iloc[-1])))
+            if self._last_chart_hash == data_hash:
+                return
 
-            # Plot the new data
-            # data.index contains the timestamps
-            # data['Close'] contains the closing prices for each minute
-            plot.plot(data.index, data['Close'], color=BLUE_ACCENT, linewidth=2)
+            # Get the chart figure, plot and price line
+            fig, plot, line = self.chart
+            blit = self._blit
+
+            # Downsample the data to about one point per 2 pixels of chart width
+            # A full trading day has ~390 minutes, which is more detail than the chart can show,
+            # and drawing fewer points makes every redraw cheaper
+            # The step is counted from the end, so the latest price is always plotted
+            width = self.chart_canvas.get_tk_widget().winfo_width()
+            if width <= 1:
+                # Tk reports a width of 1 until the chart is on screen,
+                # so use the figure's own size (12 inches x 100 dpi) instead
+                width = fig.get_figwidth() * fig.dpi
+            pts_target = min(MAX_CHART_POINTS, max(64, int(width / 2)))
+            step = max(1, len(data) // pts_target)
+            plot_data = data.iloc[::-step].iloc[::-1]
+
+            # Matplotlib can't reuse a line for pandas timestamps, so convert them to
+            # matplotlib's own date numbers
+            # (the times stay 64-bit: date numbers count days since 1970, and 32-bit
+            # numbers that large can't tell one minute from the next)
+            x = date2num(plot_data.index.to_pydatetime())
+
+            # 32-bit prices are plenty for a chart and take half the memory
+            y = plot_data['Close'].to_numpy(dtype=np.float32)
+
+            # Put the new data on the existing line
+            # (the title, labels and styling were set up once in _ensure_detail_frame)
+            # plot_data.index contains the timestamps
+            # plot_data['Close'] contains the closing prices for each minute
+            line.set_data(x, y)
 
             # Fill the area under the line with a semi-transparent blue
             # This creates a nice visual effect
-            plot.fill_between(data.index, data['Close'], alpha=0.2, color=BLUE_ACCENT)
-
-            # Set the title
-            plot.set_title(f"{symbol} - Intraday Prices", color=TEXT_COLOR, fontsize=14, fontweight='bold')
+            # (a filled area can't be given new data, so the old one is replaced)
+            if blit['fill'] is not None:
+                blit['fill'].remove()
+            blit['fill'] = plot.fill_between(x, y, alpha=0.2, color=THEME_RGB['BLUE_ACCENT'], animated=True)
+
+            # The x-axis always shows the whole trading session (9:30 to 16:00 New York time),
+            # so a new minute doesn't move it - only a new price range changes the axes
+            opening, closing = market_session(data.index[-1].tz_convert(MARKET_TZ).date())
+            session = (date2num(opening), date2num(closing))
+            if plot.get_xlim() != session:
+                plot.set_xlim(session)
+
+            # Fit the y-axis around the new prices
+            plot.relim()
+            plot.autoscale_view(scalex=False)
+            limits = (plot.get_xlim(), plot.get_ylim())
+
+            canvas = self.chart_canvas
+            if blit['background'] is None or limits != blit['limits']:
+                # The axes changed (new ticks/labels), so everything must be drawn again
+                # _on_chart_draw() then saves the new background and draws the line on top
+                # draw_idle() waits until Tk is idle, so several updates in a row are drawn only once
+                blit['limits'] = limits
+                canvas.draw_idle()
+            else:
+                # Only the line and fill changed: paste the saved background (axes, ticks,
+                # title) and draw just those two on top, which is much faster than a full draw
+                canvas.restore_region(blit['background'])
+                plot.draw_artist(blit['fill'])
+                plot.draw_artist(line)
+                canvas.blit(plot.bbox)
+
+            # Remember which data is now on the chart
+            self._last_chart_hash = data_hash
 
-            # Set the labels
-            plot.set_xlabel("Time", color=SECONDARY_TEXT)
-            plot.set_ylabel("Price ($)", color=SECONDARY_TEXT)
+        except Exception as e:
+            logger.warning("Error updating chart for %s: %s", symbol, e)
 
-            # Format the x-axis to show times (not dates)
-            # DateFormatter('%H:%M') means show hours and minutes (e.g., "09:30")
-            plot.xaxis.set_major_formatter(DateFormatter('%H:%M'))
+    # ===============================================================================================
+    # METHOD: Chart Was Fully Drawn
+    # ===============================================================================================
+    def _on_chart_draw(self):
+        """
+        Save the chart's static background and draw the animated line and fill on top.
+        """
+        fig, plot, line = self.chart
+        blit = self._blit
 
-            # Rotate the x-axis labels so they're readable
-            fig.autofmt_xdate(rotation=45)
+        blit['background'] = self.chart_canvas.copy_from_bbox(plot.bbox)
+        if blit['fill'] is not None:
+            plot.draw_artist(blit['fill'])
+        plot.draw_artist(line)
 
-            # Add a grid for easier reading
-            plot.grid(True, alpha=0.2, color=BORDER_COLOR)
+    # ===============================================================================================
+    # METHOD: Start Price Updates
+    # ===============================================================================================
+    def start_price_updates(self):
+        """
+        Start the repeating price updates, one row of cards at a time.
 
-            # Style the plot to match our dark theme
-            plot.set_facecolor(FRAME_BG)
-            plot.tick_params(colors=SECONDARY_TEXT)
-            plot.spines['bottom'].set_color(BORDER_COLOR)
-            plot.spines['left'].set_color(BORDER_COLOR)
-            plot.spines['top'].set_visible(False)
-            plot.spines['right'].set_visible(False)
+        Instead of refreshing all stocks in one burst every PRICE_UPDATE_INTERVAL, the stocks
+        are split into groups (one group per grid row) and each group's updates are started
+        at a different time, spread evenly over the interval.
+        For example, with 5 rows and a 30 second interval, a row is refreshed every 6 seconds.
+        This keeps each UI update small and sends Yahoo Finance a smooth stream of requests.
+        """
+        # Split the stocks into groups of GRID_COLUMNS (one group per row of cards)
+        groups = [STOCKS[i:i + GRID_COLUMNS] for i in range(0, len(STOCKS), GRID_COLUMNS)]
 
-            # Refresh the canvas to show the updated chart
-            self.canvases[symbol].draw()
+        # Time between the start of one group and the next
+        spacing = PRICE_UPDATE_INTERVAL // len(groups)
 
-        except Exception as e:
-            print(f"Error updating chart for {symbol}: {str(e)}")
+        for idx, group in enumerate(groups):
+            self.root.after(idx * spacing, self.update_prices, group)
 
     # ===============================================================================================
     # METHOD: Update Prices
     # ===============================================================================================
-    def update_prices(self):
+    def update_prices(self, symbols):
         """
-        Update the prices for all stocks on the main view.
+        Start a price update for a group of stocks on the main view.
+
+        Parameters:
+            symbols (tuple): The stock symbols to update (e.g., one row of cards)
 
         This method:
-        1. Fetches the current price for each stock
-        2. Updates the label with the new price
-        3. Colors the label based on whether price went up (green), down (red), or stayed same (gray)
+        1. Asks the StockDataManager to fetch the prices on the background event loop
+        2. Returns immediately so the UI stays responsive while the request is running
+        3. When the prices arrive, apply_prices() is run on the UI thread
         4. Schedules itself to run again after PRICE_UPDATE_INTERVAL milliseconds
         """
-        # Loop through each stock
-        for symbol in STOCKS:
-            try:
-                # Fetch the current price using the StockDataManager
-                price_data = self.data_manager.get_current_price(symbol)
+        # Start the fetch on the background event loop (this does NOT block)
+        future = self.data_manager.run_refresh(self._aio_loop, symbols)
 
-                # Check if there was an error
-                if price_data['error']:
-                    # Show error message in the label
-                    self.stock_labels[symbol].config(text=price_data['error'], fg=TEXT_COLOR)
-                    continue
+        # When the fetch finishes, hand the results back to the UI thread
+        # Tk widgets must only be touched from the main thread, so we never update
+        # labels here directly - root.after(0, ...) queues the work on the Tk event loop
+        future.add_done_callback(lambda f: self.root.after(0, self.apply_prices, f))
 
-                # Get the price
-                price = price_data['price']
+        # Schedule this method to run again after PRICE_UPDATE_INTERVAL milliseconds
+        self.root.after(PRICE_UPDATE_INTERVAL, self.update_prices, symbols)
+
+    # ===============================================================================================
+    # METHOD: Apply Prices
+    # ===============================================================================================
+    def apply_prices(self, future):
+        """
+        Queue the results of a finished price fetch to be shown on the cards.
+
+        Parameters:
+            future: The finished future returned by StockDataManager.run_refresh()
 
-                # Get the direction (UP, DOWN, or NEUTRAL)
-                direction = price_data['direction']
+        Several fetches can finish at almost the same time, so instead of redrawing
+        the cards for each one, the new prices are collected in self._pending and
+        shown together by _flush_pending() once Tk has nothing else to do.
+        """
+        try:
+            results = future.result()
+        except Exception as e:
+            # The whole fetch failed - keep showing the last known prices
+            logger.warning("Error updating prices: %s", e)
+            return
 
-                # Determine the color based on direction
-                if direction == 'UP':
-                    color = GREEN_UP
-                elif direction == 'DOWN':
-                    color = RED_DOWN
-                else:
-                    color = GRAY_NEUTRAL
+        # Remember the newest result for each stock (a newer one replaces an older one)
+        self._pending.update(results)
 
-                # Format the price with 2 decimal places
-                price_text = f"${price:.2f}"
+        # Schedule a single update of the cards, unless one is already scheduled
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.root.after_idle(self._flush_pending)
 
-                # Update the label
-                self.stock_labels[symbol].config(text=price_text, fg=color)
+    # ===============================================================================================
+    # METHOD: Flush Pending Prices
+    # ===============================================================================================
+    def _flush_pending(self):
+        """
+        Show all queued prices on their cards in one pass.
 
+        Each stock's card is looked up by symbol and given its new price.
+        """
+        # Update the card of each stock that we got a result for
+        for symbol, price_data in self._pending.items():
+            try:
+                self.cards[symbol].apply(price_data)
             except Exception as e:
                 # If something goes wrong, show an error
-                print(f"Error updating price for {symbol}: {str(e)}")
+                logger.warning("Error updating price for %s: %s", symbol, e)
 
-        # Schedule this method to run again after PRICE_UPDATE_INTERVAL milliseconds
-        self.root.after(PRICE_UPDATE_INTERVAL, self.update_prices)
+        self._pending.clear()
+        self._flush_scheduled = False
+
+    # ===============================================================================================
+    # METHOD: Close the Application
+    # ===============================================================================================
+    def on_close(self):
+        """
+        Close the network session, stop the background event loop and close the window.
+        """
+        # Close the aiohttp session on its own loop (wait at most 2 seconds)
+        try:
+            asyncio.run_coroutine_threadsafe(self.data_manager.close(), self._aio_loop).result(timeout=2)
+        except Exception as e:
+            logger.warning("Error closing network session: %s", e)
+
+        # Stop the background event loop and destroy the window
+        self._aio_loop.call_soon_threadsafe(self._aio_loop.stop)
+        self.root.destroy()
 
 
 # =====================================================================================================
@@ -635,6 +1326,9 @@ class ModernStockViewer:
 # This code runs when we execute the script with: python main.py
 
 if __name__ == "__main__":
+    # Show warnings (like failed fetches) in the terminal, with the time they happened
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
     # Create the root tkinter window
     root = tk.Tk()
 
@@ -6,8 +6,604 @@
 # This makes it easier to maintain and test the code
 # =====================================================================================================
 
-import yfinance as yf
-from datetime import datetime
+import asyncio
+import functools
+import inspect
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+import aiohttp
+import diskcache
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from constants import (STOCKS, QUOTE_TTL_S, INFO_TTL_S,
+                       HISTORY_FILE_TTL_S, RECENT_FILE_TTL_S)
+
+# pandas, pyarrow and requests are NOT imported here: like yfinance (see StockDataManager.yf)
+# they take a noticeable moment to load and aren't needed until the first fetch, so each
+# function that uses them imports them itself (after the first time that's just a lookup)
+
+# Messages about failed fetches go to this logger instead of being printed
+# (the app decides where they're shown; a disabled level costs almost nothing)
+logger = logging.getLogger(__name__)
+
+# Folder where downloaded chart data is saved between app runs (next to this file)
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+
+# Yahoo Finance quote endpoint - accepts a comma-separated list of symbols so that
+# ALL stocks can be fetched with one single HTTP request
+QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote?symbols="
+
+# Most symbols asked for in one yfinance download (Yahoo's limit per request)
+DOWNLOAD_CHUNK_SIZE = 10
+
+# How long (in seconds) a stock isn't asked for again after Yahoo answered
+# "429 Too Many Requests" - asking again right away only makes the limit last longer
+RATE_LIMIT_COOLDOWN_S = 60
+
+# The errors a request to Yahoo is expected to fail with, turned into an error result:
+# network problems, timeouts and an answer that isn't valid JSON
+# Anything else is a bug in the app and is not hidden
+_HTTP_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, json.JSONDecodeError)
+
+# The time zone of the New York Stock Exchange (its opening hours are in New York time)
+MARKET_TZ = ZoneInfo("America/New_York")
+
+# Most requests sent to Yahoo at the same time when stocks have to be fetched one by one
+# (more than this quickly gets answered with "429 Too Many Requests")
+MAX_WORKERS = 8
+
+
+@functools.cache
+def _fetch_errors():
+    """
+    Return the errors a yfinance fetch is expected to fail with (network problems
+    and errors reported by yfinance), as one tuple for an except clause.
+
+    yfinance is only imported when it's first needed (see StockDataManager.yf), so its
+    errors are looked up here, the first time one has to be matched, and then remembered.
+    """
+    import requests
+    from yfinance.exceptions import YFException
+
+    errors = (requests.exceptions.RequestException, YFException)
+    # Newer yfinance versions send their requests with curl_cffi, which has its own errors
+    try:
+        from curl_cffi.requests.exceptions import RequestException as CurlRequestException
+    except ImportError:
+        return errors
+    return errors + (CurlRequestException,)
+
+
+# =====================================================================================================
+# RESULT TYPES
+# =====================================================================================================
+# Every price fetch (single stock, batched quote request or bulk download) returns a PriceResult,
+# and every information fetch a StockInfoResult, so the UI doesn't need to know which data source
+# was used. They're small fixed-field objects (slots), which are lighter than a dictionary per result
+# and can't be changed by accident after they're made (frozen).
+
+@dataclass(slots=True, frozen=True)
+class PriceResult:
+    """
+    The current price of a stock and which way it moved.
+
+    Attributes:
+        price: Current stock price (None if the fetch failed)
+        direction: Either 'UP' (green), 'DOWN' (red), or 'NEUTRAL' (gray)
+        previous_price: The price it's compared against (None if the fetch failed)
+        change: The price difference (current - previous)
+        change_pct: The change since the previous trading day's close, in percent
+                    (0 if that close isn't known)
+        error: Error message if something went wrong (or None if successful)
+    """
+    price: float | None
+    direction: str
+    previous_price: float | None
+    change: float
+    change_pct: float
+    error: str | None
+
+
+@dataclass(slots=True, frozen=True)
+class StockInfoResult:
+    """
+    Detailed information about a stock, already formatted for display.
+
+    Attributes:
+        market_cap: Market capitalization (e.g., "$2.80T")
+        pe_ratio: Price to Earnings ratio (e.g., "28.50")
+        dividend_yield: Dividend yield (e.g., "0.42%")
+        week_52_high: Highest price in last 52 weeks
+        week_52_low: Lowest price in last 52 weeks
+        day_high: Highest price today
+        day_low: Lowest price today
+        error: Error message if something went wrong (or None if successful)
+    """
+    market_cap: str
+    pe_ratio: str
+    dividend_yield: str
+    week_52_high: str
+    week_52_low: str
+    day_high: str
+    day_low: str
+    error: str | None
+
+
+# =====================================================================================================
+# PRICE RESULT HELPERS
+# =====================================================================================================
+
+# The direction for each sign of a price change (numpy.sign gives 1.0, -1.0 or 0.0)
+_DIRECTIONS = {1.0: 'UP', -1.0: 'DOWN', 0.0: 'NEUTRAL'}
+
+
+def _price_result(current_price, previous_price, previous_close=None):
+    """
+    Build a price result from the current and previous price.
+
+    Parameters:
+        current_price (float): The latest price
+        previous_price (float): The price to compare against (gives the direction)
+        previous_close (float): The previous trading day's closing price (gives change_pct),
+                                or None if it isn't known
+
+    Returns:
+        PriceResult: The price, its direction and change (error is always None)
+    """
+    # Calculate the change (difference between current and previous)
+    change = current_price - previous_price
+
+    # The percentage is the day's change, like on a stock ticker
+    change_pct = (current_price - previous_close) / previous_close * 100 if previous_close else 0
+
+    # Determine the direction (UP, DOWN, or NEUTRAL) from the sign of the change
+    # (a missing price gives NaN, which has no sign and counts as NEUTRAL)
+    direction = _DIRECTIONS.get(float(np.sign(change)), 'NEUTRAL')
+
+    return PriceResult(
+        price=float(current_price),
+        direction=direction,
+        previous_price=float(previous_price),
+        change=float(change),
+        change_pct=float(change_pct),
+        error=None
+    )
+
+
+def _price_results(last_two, previous_closes):
+    """
+    Build the price results for many stocks at once.
+
+    Parameters:
+        last_two (dict): symbol -> (previous price, current price)
+        previous_closes (dict): symbol -> the previous trading day's closing price
+                                (stocks that are missing get a change_pct of 0)
+
+    Returns:
+        dict: A PriceResult for each symbol, like _price_result() would make
+
+    The changes and directions of all stocks are worked out together with numpy
+    (one subtraction and one numpy.sign for the whole array) instead of one stock at a time.
+    """
+    if not last_two:
+        return {}
+
+    # One row per stock: [previous price, current price]
+    closes = np.array(list(last_two.values()), dtype=float)
+    previous, current = closes[:, 0], closes[:, 1]
+    changes = current - previous
+
+    # The day's change in percent - a missing (NaN) or 0 previous close gives 0
+    # instead of a division by zero
+    closes_before = np.array([previous_closes.get(symbol, np.nan) for symbol in last_two], dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        changes_pct = np.where(closes_before > 0, (current - closes_before) / closes_before * 100, 0.0)
+    signs = np.sign(changes)
+
+    # .tolist() turns the arrays into plain Python floats in one go
+    return {
+        symbol: PriceResult(
+            price=price,
+            direction=_DIRECTIONS.get(sign, 'NEUTRAL'),
+            previous_price=previous_price,
+            change=change,
+            change_pct=change_pct,
+            error=None
+        )
+        for symbol, price, previous_price, change, change_pct, sign in zip(
+            last_two, current.tolist(), previous.tolist(), changes.tolist(),
+            changes_pct.tolist(), signs.tolist())
+    }
+
+
+def _price_error(message):
+    """Build a price result for a fetch that failed."""
+    return PriceResult(
+        price=None,
+        direction='NEUTRAL',
+        previous_price=None,
+        change=0.0,
+        change_pct=0.0,
+        error=message
+    )
+
+
+def _info_error(message):
+    """
+    Build a stock information result for a failed fetch.
+
+    Parameters:
+        message (str): What went wrong
+
+    Returns:
+        StockInfoResult: "N/A" for every field, with the message as the error
+    """
+    return StockInfoResult(
+        market_cap="N/A",
+        pe_ratio="N/A",
+        dividend_yield="N/A",
+        week_52_high="N/A",
+        week_52_low="N/A",
+        day_high="N/A",
+        day_low="N/A",
+        error=message
+    )
+
+
+def _is_rate_limited(error):
+    """Return True if an error means Yahoo answered "429 Too Many Requests"."""
+    response = getattr(error, 'response', None)
+    if getattr(response, 'status_code', None) == 429:
+        return True
+    # Newer yfinance versions raise their own error for this
+    return type(error).__name__ == 'YFRateLimitError'
+
+
+# =====================================================================================================
+# MARKET HOURS
+# =====================================================================================================
+# The US stock market is open Monday to Friday, 9:30 to 16:00 New York time.
+# While it's closed, prices don't change, so there's no need to download them again.
+# (Market holidays aren't known here - on those days the prices are just downloaded as usual.)
+
+def _market_is_open(now):
+    """Return True if the stock market is open at the given New York time."""
+    if now.weekday() >= 5:  # Saturday or Sunday
+        return False
+    minutes = now.hour * 60 + now.minute
+    return 9 * 60 + 30 <= minutes < 16 * 60
+
+
+def market_session(day):
+    """
+    Return when the stock market opens and closes (New York time) on a day.
+
+    Parameters:
+        day (datetime.date): The trading day
+
+    Returns:
+        tuple: (opening datetime, closing datetime), both in MARKET_TZ
+    """
+    opening = datetime(day.year, day.month, day.day, 9, 30, tzinfo=MARKET_TZ)
+    closing = datetime(day.year, day.month, day.day, 16, 0, tzinfo=MARKET_TZ)
+    return opening, closing
+
+
+def _session_date(timestamp):
+    """Return the New York date of the trading session a (time zone aware) price timestamp is from."""
+    return timestamp.tz_convert(MARKET_TZ).date()
+
+
+def _next_market_open(now):
+    """Return the next time (New York time) the stock market opens after the given time."""
+    opening = now.replace(hour=9, minute=30, second=0, microsecond=0)
+    if now >= opening:
+        opening += timedelta(days=1)
+    while opening.weekday() >= 5:  # Skip the weekend
+        opening += timedelta(days=1)
+    return opening
+
+
+# =====================================================================================================
+# NUMBER FORMATTING
+# =====================================================================================================
+
+# (smallest value, divisor, suffix) for large amounts, biggest first
+# e.g., 2800000000000 becomes "$2.80T" (2.8 Trillion)
+_FORMAT_TABLE = (
+    (1e12, 1e12, 'T'),  # Trillions
+    (1e9, 1e9, 'B'),    # Billions
+    (1e6, 1e6, 'M'),    # Millions
+)
+
+
+def _format_money(value):
+    """
+    Format an amount of money nicely, shortening large amounts (e.g., "$2.80T").
+
+    Parameters:
+        value (float): The amount (text is returned unchanged, None becomes "N/A")
+
+    Returns:
+        str: The formatted amount
+    """
+    if value is None:
+        return "N/A"
+    if isinstance(value, str):
+        return value
+
+    value = float(value)
+    size = abs(value)
+    for threshold, divisor, suffix in _FORMAT_TABLE:
+        if size >= threshold:
+            return f"${value / divisor:.2f}{suffix}"
+
+    # Otherwise just show it as is
+    return f"${value:.2f}"
+
+
+def _money_or_na(value):
+    """
+    Format a price as dollars and cents (e.g., "$182.52"), or "N/A" if it's missing.
+
+    Parameters:
+        value (float): The price (None or 0 means Yahoo Finance didn't have it)
+
+    Returns:
+        str: The formatted price
+    """
+    return f"${value:.2f}" if value else "N/A"
+
+
+# The prices shown on the detail view, as (StockInfoResult field, Ticker.fast_info attribute)
+# They're all formatted the same way, so get_stock_info() fills them in with one loop
+_MONEY_FIELDS = (
+    ('week_52_high', 'year_high'),
+    ('week_52_low', 'year_low'),
+    ('day_high', 'day_high'),
+    ('day_low', 'day_low'),
+)
+
+# The fields read from the full company information dictionary (Ticker.get_info()),
+# in the order get_stock_info() unpacks them
+_INFO_KEYS = ('trailingPE', 'dividendYield')
+
+
+# =====================================================================================================
+# PARALLEL FETCH HELPER
+# =====================================================================================================
+
+def _fetch_each(fetch, symbols):
+    """
+    Call fetch(symbol) for every symbol, up to MAX_WORKERS at the same time.
+
+    Parameters:
+        fetch: A function that takes one symbol and returns its result
+        symbols (list): The stock ticker symbols
+
+    Returns:
+        dict: The result of fetch() for each symbol, keyed by symbol
+
+    The calls spend almost all their time waiting for the network, so together they
+    take about as long as the slowest one instead of the sum of all of them.
+    """
+    symbols = list(symbols)
+    results = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_WORKERS, len(symbols)))) as pool:
+        futures = {pool.submit(fetch, symbol): symbol for symbol in symbols}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    return results
+
+
+# =====================================================================================================
+# TTL CACHE DECORATOR
+# =====================================================================================================
+# Wraps a StockDataManager fetch method so its result is remembered for a number of seconds.
+# Calling the method again with the same symbol inside that window returns the stored result
+# instantly instead of making another HTTP request. Works for both normal and async methods.
+# Failed fetches are never cached, so the next call tries again right away.
+
+def _has_error(value):
+    """Return True if a fetch result is empty or reports an error (and shouldn't be cached)."""
+    if value is None:
+        return True
+    if isinstance(value, (PriceResult, StockInfoResult)):
+        return bool(value.error)
+    if isinstance(value, dict):
+        # fetch_quotes() returns one result per symbol
+        return any(isinstance(v, PriceResult) and v.error for v in value.values())
+    return False
+
+
+def ttl_cache(seconds):
+    """
+    Cache the result of a StockDataManager method for the given number of seconds.
+
+    Parameters:
+        seconds (float): How long a cached result stays valid (its "time to live")
+
+    The cache lives in the manager's self._cache dictionary and is keyed by
+    (symbol, method name), e.g. ("AAPL", "_minute_history").
+    """
+    def decorator(fn):
+        endpoint = fn.__name__
+
+        def make_key(symbol):
+            # A list of symbols can't be a dictionary key, so turn it into a tuple
+            if isinstance(symbol, list):
+                symbol = tuple(symbol)
+            return (symbol, endpoint)
+
+        def lookup(self, key):
+            # Return the cached value if it's still fresh, otherwise None
+            hit = self._cache.get(key)
+            if hit is not None and time.monotonic() - hit[0] < seconds:
+                return hit[1]
+            return None
+
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(self, symbol):
+                key = make_key(symbol)
+                value = lookup(self, key)
+                if value is None:
+                    value = await fn(self, symbol)
+                    if not _has_error(value):
+                        self._cache[key] = (time.monotonic(), value)
+                return value
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(self, symbol):
+            key = make_key(symbol)
+            value = lookup(self, key)
+            if value is None:
+                value = fn(self, symbol)
+                if not _has_error(value):
+                    self._cache[key] = (time.monotonic(), value)
+            return value
+        return wrapper
+
+    return decorator
+
+
+# =====================================================================================================
+# FILE CACHE CLASS
+# =====================================================================================================
+# Saves pandas DataFrames as parquet files in the .cache folder, so chart data downloaded in one
+# run of the app can be reused the next time it starts. Each file remembers when it was written
+# and how long it's valid for; expired files are treated as if they didn't exist, and are
+# deleted from time to time when new data is saved, so the folder doesn't keep growing.
+
+class FileCache:
+    """
+    Simple on-disk cache of DataFrames, stored as .cache/{key}.parquet files.
+    """
+
+    # Names of the extra fields stored in each parquet file's header (metadata)
+    _TIMESTAMP_FIELD = b'stockview_timestamp'
+    _TTL_FIELD = b'stockview_ttl'
+
+    # How often (in seconds) set() looks for expired files to delete
+    _PRUNE_INTERVAL_S = 60 * 60
+
+    def __init__(self, directory=CACHE_DIR):
+        """
+        Initialize the FileCache.
+
+        Parameters:
+            directory (str): The folder to store the cache files in
+        """
+        self.directory = directory
+
+        # When expired files were last deleted (time.monotonic(), None = not yet)
+        self._last_prune = None
+
+    def _path(self, key):
+        """Return the file path used for a cache key."""
+        return os.path.join(self.directory, f"{key}.parquet")
+
+    def get(self, key):
+        """
+        Read a cached DataFrame from disk.
+
+        Parameters:
+            key (str): The cache key (e.g., "AAPL_1m_2024-05-01")
+
+        Returns:
+            pandas.DataFrame: The cached data, or None if it's missing, expired or unreadable
+        """
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+
+        import pyarrow.parquet as pq
+
+        try:
+            table = pq.read_table(path)
+            metadata = table.schema.metadata or {}
+            written_at = float(metadata[self._TIMESTAMP_FIELD])
+            ttl = float(metadata[self._TTL_FIELD])
+
+            # The file is too old - ignore it
+            if time.time() - written_at >= ttl:
+                return None
+
+            return table.to_pandas()
+
+        except Exception as e:
+            # A broken cache file shouldn't break the app - just fetch the data again
+            logger.warning("Error reading cache file %s: %s", path, e)
+            return None
+
+    def set(self, key, df, ttl):
+        """
+        Save a DataFrame to disk.
+
+        Parameters:
+            key (str): The cache key (e.g., "AAPL_1m_2024-05-01")
+            df (pandas.DataFrame): The data to save
+            ttl (float): How many seconds the saved data stays valid
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+
+            # Store the write time and TTL in the file header next to pandas' own metadata
+            table = pa.Table.from_pandas(df)
+            metadata = dict(table.schema.metadata or {})
+            metadata[self._TIMESTAMP_FIELD] = str(time.time()).encode()
+            metadata[self._TTL_FIELD] = str(ttl).encode()
+            pq.write_table(table.replace_schema_metadata(metadata), self._path(key))
+
+        except Exception as e:
+            logger.warning("Error writing cache file for %s: %s", key, e)
+            return
+
+        # Delete expired files, at most once every _PRUNE_INTERVAL_S seconds
+        now = time.monotonic()
+        if self._last_prune is None or now - self._last_prune >= self._PRUNE_INTERVAL_S:
+            self._last_prune = now
+            self.prune()
+
+    def prune(self):
+        """
+        Delete the cache files whose TTL has passed.
+
+        Each day's chart data has its own file, and a past day's file is never asked
+        for again, so without this the cache folder would keep growing.
+        Only the file headers are read, not the data itself.
+        """
+        import pyarrow.parquet as pq
+
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+
+        for name in names:
+            if not name.endswith(".parquet"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                metadata = pq.read_schema(path).metadata or {}
+                written_at = float(metadata[self._TIMESTAMP_FIELD])
+                ttl = float(metadata[self._TTL_FIELD])
+                if time.time() - written_at >= ttl:
+                    os.remove(path)
+            except Exception as e:
+                # Leave files that can't be read or deleted, they're skipped by get() anyway
+                logger.warning("Error pruning cache file %s: %s", path, e)
+
 
 # =====================================================================================================
 # STOCK DATA MANAGER CLASS
@@ -27,15 +623,469 @@ class StockDataManager:
     def __init__(self):
         """
         Initialize the StockDataManager.
-        Currently just a placeholder, but could be used for caching in the future.
+        Sets up the in-memory cache and the (lazily created) aiohttp session
+        used for batched quote requests.
         """
-        # Cache could be added here to store previously fetched data
-        # This would make the app faster by avoiding repeated API calls
-        pass
+        # Cache of previously fetched data, used by the @ttl_cache methods
+        # Key: (symbol, method name) -> Value: (time it was fetched, result)
+        # This makes the app faster by avoiding repeated API calls
+        self._cache = {}
+
+        # On-disk cache for intraday chart data, so it survives app restarts
+        self.file_cache = FileCache()
+
+        # On-disk cache for company information, so restarting the app within
+        # INFO_TTL_S (24 hours) doesn't download it again
+        self.disk = diskcache.Cache(os.path.join(CACHE_DIR, "info"))
+
+        # The last price seen for each stock by fetch_quotes()
+        # Used to tell whether the price went up or down since the previous refresh
+        self._last_prices = {}
+
+        # The yfinance module, imported the first time it's needed (see the yf property)
+        self._yf = None
+
+        # One yfinance Ticker object per stock, created the first time it's needed:
+        # symbol -> (time.monotonic() when it was created, Ticker) (see _ticker)
+        self._tickers = {}
+
+        # When each stock may be asked for again after Yahoo rate-limited it
+        # (time.monotonic() values, see _cooling_down)
+        self._rate_limited_until = {}
+
+        # Prices downloaded while the market was closed: symbol -> (next market open, result)
+        # They can't change until the market opens again, so they're reused until then
+        self._last_close_cache = {}
+
+        # The previous trading day's closing price of each stock, used for change_pct:
+        # symbol -> (date of the session it's the close before, price) (see _previous_closes)
+        self._previous_close_cache = {}
+
+        # The aiohttp session used for batched quote requests
+        # It's created lazily (inside the asyncio event loop) and then kept alive
+        # so the TCP/TLS connection to Yahoo Finance is reused between refreshes
+        self._session = None
+
+        # Set once Yahoo refuses the quote endpoint (HTTP 401/403: it wants a cookie and crumb
+        # that we don't have), so fetch_quotes() goes straight to the bulk downloads after that
+        self._quotes_unavailable = False
+
+        # yfinance calls are NOT given a session of our own: yfinance keeps one shared
+        # session (with Yahoo's cookie and crumb) for all Tickers and downloads by itself,
+        # and newer versions refuse a plain requests.Session
+
+    # ================================================================================================
+    # ASYNC CONTEXT MANAGER - "async with StockDataManager() as manager:"
+    # ================================================================================================
+    async def __aenter__(self):
+        """Open the shared aiohttp session when entering an 'async with' block."""
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        """Close the shared aiohttp session when leaving an 'async with' block."""
+        await self.close()
+
+    async def _get_session(self):
+        """
+        Return the shared aiohttp session, creating it the first time it's needed.
+
+        The connector allows one connection per stock and keeps connections alive,
+        so after the first refresh no new TCP/TLS handshakes are needed.
+        Yahoo's address is remembered for 5 minutes, so it isn't looked up for every request.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=len(STOCKS), keepalive_timeout=60, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers={'User-Agent': 'Mozilla/5.0'},
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+        return self._session
+
+    async def close(self):
+        """Close the shared aiohttp session (if it was ever opened)."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    # ================================================================================================
+    # PROPERTY: The yfinance Module (loaded lazily)
+    # ================================================================================================
+    @property
+    def yf(self):
+        """
+        Return the yfinance module, importing it the first time it's used.
+
+        yfinance loads a lot of other libraries when it's imported, which takes a
+        noticeable moment. Waiting until the first fetch lets the window appear first.
+        """
+        if self._yf is None:
+            import yfinance
+            self._yf = yfinance
+        return self._yf
+
+    # ================================================================================================
+    # METHOD: Get a Stock's Ticker Object
+    # ================================================================================================
+    def _ticker(self, symbol):
+        """
+        Return the yfinance Ticker object for a stock, creating it the first time.
+
+        Parameters:
+            symbol (str): The stock ticker symbol (e.g., "AAPL")
+
+        A Ticker remembers what it has already looked up (like the stock's time zone),
+        so keeping it saves those extra requests on every later fetch.
+        It also remembers the company information it downloaded, so it's replaced
+        with a new one after INFO_TTL_S seconds, when that information is out of date.
+        """
+        saved = self._tickers.get(symbol)
+        now = time.monotonic()
+        if saved is None or now - saved[0] >= INFO_TTL_S:
+            saved = (now, self.yf.Ticker(symbol))
+            self._tickers[symbol] = saved
+        return saved[1]
+
+    # ================================================================================================
+    # METHOD: Rate Limit Cooldown
+    # ================================================================================================
+    def _cooling_down(self, symbol):
+        """Return True if Yahoo rate-limited this stock less than RATE_LIMIT_COOLDOWN_S seconds ago."""
+        return time.monotonic() < self._rate_limited_until.get(symbol, 0)
+
+    def _note_error(self, symbol, error):
+        """Start the cooldown for a stock if a fetch failed because Yahoo rate-limited it."""
+        if _is_rate_limited(error):
+            self._rate_limited_until[symbol] = time.monotonic() + RATE_LIMIT_COOLDOWN_S
+
+    # ================================================================================================
+    # METHOD: Fetch Quotes for Many Stocks at Once (async)
+    # ================================================================================================
+    @ttl_cache(QUOTE_TTL_S)
+    async def fetch_quotes(self, symbols):
+        """
+        Get the current price of several stocks with ONE batched HTTP request.
+
+        Parameters:
+            symbols (list): The stock ticker symbols (e.g., ["AAPL", "MSFT"])
+
+        Returns:
+            dict: A dictionary keyed by symbol, where each value is a PriceResult
+                  like the result of get_current_price()
+
+        How it works:
+            1. Build one quote URL containing every symbol (e.g., "...?symbols=AAPL,MSFT")
+            2. Send it over the shared aiohttp session (no blocking of the UI)
+            3. Compare each stock's price with the one from the previous refresh
+               (or yesterday's close the first time) to get the direction
+            4. If the quote request fails, fall back to get_current_prices() (bulk downloads)
+               If Yahoo refused it as unauthorized, every later call uses the fallback directly
+        """
+        # The fallback: bulk yfinance downloads, run in a worker thread
+        # so the event loop keeps serving other requests meanwhile
+        loop = asyncio.get_running_loop()
+        if self._quotes_unavailable:
+            return await loop.run_in_executor(None, self.get_current_prices, list(symbols))
+
+        try:
+            session = await self._get_session()
+            url = QUOTE_URL + ",".join(symbols)
+
+            async with session.get(url) as response:
+                response.raise_for_status()
+                payload = await response.json()
+
+        except _HTTP_ERRORS as e:
+            # Yahoo refused the request (no cookie/crumb): it will keep refusing it,
+            # so say so once and stop asking
+            if isinstance(e, aiohttp.ClientResponseError) and e.status in (401, 403):
+                self._quotes_unavailable = True
+                logger.warning(
+                    "Batched quote endpoint refused (HTTP %s), using bulk downloads from now on",
+                    e.status,
+                )
+            else:
+                # Any other failure (network error, bad response, etc.) may be temporary
+                logger.warning("Batched quote request failed, using bulk download: %s", e)
+            return await loop.run_in_executor(None, self.get_current_prices, list(symbols))
+
+        # The quotes live under quoteResponse -> result, one entry per symbol
+        # (missing parts of the answer just leave those stocks without a quote)
+        quote_response = payload.get('quoteResponse') or {}
+        quotes = {
+            quote.get('symbol'): quote
+            for quote in quote_response.get('result') or []
+        }
+
+        results = {}
+        for symbol in symbols:
+            quote = quotes.get(symbol, {})
+            current_price = quote.get('regularMarketPrice')
+
+            # Compare with the price we saw on the previous refresh, so the direction shows
+            # the latest movement (like get_current_price) without a second request
+            # On the very first refresh, fall back to yesterday's closing price
+            previous_close = quote.get('regularMarketPreviousClose')
+            previous_price = self._last_prices.get(symbol, previous_close)
+
+            # Yahoo didn't return a usable quote for this symbol
+            if current_price is None or previous_price is None:
+                results[symbol] = _price_error(f'Insufficient data for {symbol}')
+                continue
+
+            results[symbol] = _price_result(current_price, previous_price, previous_close)
+            self._last_prices[symbol] = float(current_price)
+
+        return results
+
+    # ================================================================================================
+    # METHOD: Schedule a Price Refresh on the asyncio Event Loop
+    # ================================================================================================
+    def run_refresh(self, loop, symbols=STOCKS):
+        """
+        Schedule fetch_quotes() on an asyncio event loop from normal (non-async) code.
+
+        Parameters:
+            loop: A running asyncio event loop (usually in a background thread)
+            symbols (list): The stock symbols to refresh (defaults to all STOCKS)
+
+        Returns:
+            concurrent.futures.Future: Resolves to the fetch_quotes() result dict
+
+        This is meant to be called from a Tk after() callback - it returns
+        immediately, so the UI never waits for the network.
+        """
+        return asyncio.run_coroutine_threadsafe(self.fetch_quotes(symbols), loop)
+
+    # ================================================================================================
+    # METHOD: Refresh All Prices with One Bulk Download
+    # ================================================================================================
+    def refresh_all(self, symbols):
+        """
+        Get the current price of several stocks with ONE yfinance download call.
+
+        Parameters:
+            symbols (list): The stock ticker symbols (e.g., ["AAPL", "MSFT"])
+
+        Returns:
+            dict: A dictionary keyed by symbol, where each value is a PriceResult
+                  like the result of get_current_price()
+
+        How it works:
+            1. Download today's 1-minute data for every symbol at once
+               (yfinance parallelizes this internally and reuses its own session)
+            2. Take the last two minutes of each symbol's slice of the combined dataframe
+            3. Compare the latest prices with the previous minute's prices, all at once
+               (for the direction), and with the previous day's close (for change_pct)
+            4. Fetch the stocks the download has no usable data for with refresh_each()
+               (yfinance catches most request errors itself and just leaves those stocks empty)
+        """
+        try:
+            # group_by="ticker" gives columns like ("AAPL", "Close"), ("MSFT", "Close"), ...
+            data = self.yf.download(
+                list(symbols),
+                period="1d",
+                interval="1m",
+                group_by="ticker",
+                threads=True,
+                progress=False
+            )
+        except _fetch_errors() as e:
+            logger.warning("Bulk download failed, fetching stocks one by one: %s", e)
+            return self.refresh_each(symbols)
+
+        # yfinance has loaded pandas by now, so this import costs nothing
+        import pandas as pd
+
+        results = {}
+        last_two = {}
+        sessions = {}
+        missing = []
+        for symbol in symbols:
+            try:
+                # Drop the minutes where this stock didn't trade
+                # (some yfinance versions leave out the symbol level when only one
+                # symbol was downloaded)
+                frame = data[symbol] if isinstance(data.columns, pd.MultiIndex) else data
+                closes = frame['Close'].dropna()
+            except KeyError:
+                closes = None
+
+            # Not enough data points to compare - try this stock on its own below
+            if closes is None or len(closes) < 2:
+                missing.append(symbol)
+                continue
+
+            last_two[symbol] = closes.to_numpy()[-2:]
+            sessions[symbol] = _session_date(closes.index[-1])
+
+        # Work out the changes of all stocks at once
+        results.update(_price_results(last_two, self._previous_closes(sessions)))
+
+        # The download failed for these stocks (yfinance doesn't raise an error for that),
+        # so fetch them one by one
+        if missing:
+            logger.warning("Bulk download had no data for %s, fetching them one by one", ", ".join(missing))
+            results.update(self.refresh_each(missing))
+        return results
+
+    # ================================================================================================
+    # METHOD: Get the Previous Trading Day's Closing Prices
+    # ================================================================================================
+    def _previous_closes(self, sessions):
+        """
+        Get the closing price of the trading day before each stock's current session.
+
+        Parameters:
+            sessions (dict): symbol -> the date (in New York) of the session its latest price is from
+
+        Returns:
+            dict: symbol -> previous closing price (stocks it couldn't be found for are left out)
+
+        The closes only change once a day, so they're remembered per session and only
+        downloaded (as daily bars, with one bulk request) when a new session starts.
+        """
+        results = {}
+        missing = []
+        for symbol, session in sessions.items():
+            saved = self._previous_close_cache.get(symbol)
+            if saved is not None and saved[0] == session:
+                results[symbol] = saved[1]
+            else:
+                missing.append(symbol)
+
+        if not missing:
+            return results
+
+        try:
+            # 5 days of daily bars always include the previous trading day, even after a long weekend
+            data = self.yf.download(
+                missing,
+                period="5d",
+                interval="1d",
+                group_by="ticker",
+                threads=True,
+                progress=False
+            )
+        except _fetch_errors() as e:
+            logger.warning("Error fetching previous closing prices: %s", e)
+            return results
+
+        # yfinance has loaded pandas by now, so this import costs nothing
+        import pandas as pd
+
+        for symbol in missing:
+            try:
+                frame = data[symbol] if isinstance(data.columns, pd.MultiIndex) else data
+                closes = frame['Close'].dropna()
+            except KeyError:
+                continue
+
+            # The last daily bar from before the current session
+            earlier = closes[closes.index.date < sessions[symbol]]
+            if earlier.empty:
+                continue
+            close = float(earlier.iloc[-1])
+            self._previous_close_cache[symbol] = (sessions[symbol], close)
+            results[symbol] = close
+
+        return results
+
+    # ================================================================================================
+    # METHOD: Refresh Prices One Stock at a Time (in parallel)
+    # ================================================================================================
+    def refresh_each(self, symbols):
+        """
+        Get the current price of several stocks with one request per stock.
+
+        Parameters:
+            symbols (list): The stock ticker symbols (e.g., ["AAPL", "MSFT"])
+
+        Returns:
+            dict: A dictionary keyed by symbol, same shape as refresh_all()
+
+        The requests run at the same time (see _fetch_each).
+        """
+        return _fetch_each(self._fetch_price, symbols)
+
+    # ================================================================================================
+    # METHOD: Get Current Prices of Many Stocks
+    # ================================================================================================
+    def get_current_prices(self, symbols):
+        """
+        Get the current price of several stocks, with as few downloads as possible.
+
+        Parameters:
+            symbols (list): The stock ticker symbols (e.g., ["AAPL", "MSFT"])
+
+        Returns:
+            dict: A dictionary keyed by symbol, where each value is a PriceResult
+                  like the result of get_current_price()
+
+        The symbols are split into groups of DOWNLOAD_CHUNK_SIZE and each group is
+        fetched with one refresh_all() download, instead of one request per stock.
+
+        While the market is closed, a stock's price is downloaded only once and then
+        reused until the market opens again.
+        """
+        now = datetime.now(MARKET_TZ)
+
+        # Use the prices saved since the market closed, if there are any
+        results = {}
+        for symbol in symbols:
+            saved = self._closed_price(symbol, now)
+            if saved is not None:
+                results[symbol] = saved
+
+        missing = [symbol for symbol in symbols if symbol not in results]
+        fetched = {}
+        for start in range(0, len(missing), DOWNLOAD_CHUNK_SIZE):
+            fetched.update(self.refresh_all(missing[start:start + DOWNLOAD_CHUNK_SIZE]))
+
+        # Save the closing prices until the market opens
+        for symbol, result in fetched.items():
+            self._save_closed_price(symbol, result, now)
+
+        results.update(fetched)
+        return results
+
+    # ================================================================================================
+    # METHOD: Prices Saved While the Market Is Closed
+    # ================================================================================================
+    def _closed_price(self, symbol, now):
+        """
+        Return the price saved for a stock since the market closed, or None.
+
+        Parameters:
+            symbol (str): The stock ticker symbol (e.g., "AAPL")
+            now (datetime): The current New York time
+
+        While the market is open there's never a saved price, so None is returned.
+        """
+        if _market_is_open(now):
+            return None
+        saved = self._last_close_cache.get(symbol)
+        if saved is not None and now < saved[0]:
+            return saved[1]
+        return None
+
+    def _save_closed_price(self, symbol, result, now):
+        """
+        Remember a price fetched while the market is closed, until it opens again.
+
+        Parameters:
+            symbol (str): The stock ticker symbol (e.g., "AAPL")
+            result (PriceResult): The fetched price (errors are never saved)
+            now (datetime): The New York time it was fetched at
+        """
+        if not result.error and not _market_is_open(now):
+            self._last_close_cache[symbol] = (_next_market_open(now), result)
 
     # ================================================================================================
     # METHOD: Get Current Price and Direction
     # ================================================================================================
+    @ttl_cache(QUOTE_TTL_S)
     def get_current_price(self, symbol):
         """
         Get the current price of a stock and determine if it went UP or DOWN.
@@ -44,75 +1094,89 @@ class StockDataManager:
             symbol (str): The stock ticker symbol (e.g., "AAPL" for Apple)
 
         Returns:
-            dict: A dictionary containing:
-                - 'price': Current stock price (float)
-                - 'direction': Either 'UP' (green), 'DOWN' (red), or 'NEUTRAL' (gray)
-                - 'previous_price': The price from the previous minute
-                - 'change': The price difference (current - previous)
-                - 'error': Error message if something went wrong (or None if successful)
+            PriceResult: The current price, the price from the previous minute,
+                         the direction and change, or the error if something went wrong
+
+        The price is read from the same minute history as get_intraday_data(), so showing a
+        stock's price and its chart together costs one download, and both show the same last minute.
+        The result is cached for QUOTE_TTL_S seconds, like the batched quotes, and while the
+        market is closed it's reused until the market opens again (like get_current_prices()).
+        """
+        return self._fetch_price(symbol)
+
+    # ================================================================================================
+    # METHOD: Fetch One Stock's Price
+    # ================================================================================================
+    def _fetch_price(self, symbol):
+        """
+        Get the current price of a stock with its own request (used by refresh_each()).
+
+        Parameters:
+            symbol (str): The stock ticker symbol (e.g., "AAPL" for Apple)
+
+        Returns:
+            PriceResult: Same as get_current_price()
 
         How it works:
-            1. Create a Ticker object for the stock symbol
-            2. Get 1 minute interval data for today (this gives us minute-by-minute prices)
+            1. While the market is closed, reuse the price saved since it closed (if there is one)
+            2. Get today's minute-by-minute prices from _minute_history()
             3. Compare the latest price with the previous price
             4. Return green if price went up, red if down, gray if same
         """
-        try:
-            # Create a Ticker object - this is Yahoo Finance's way of accessing stock data
-            ticker = yf.Ticker(symbol)
-
-            # Get historical data for today, with 1-minute intervals
-            # period="1d" means "get data for 1 day (today)"
-            # interval="1m" means "get data for every 1 minute"
-            data = ticker.history(period="1d", interval="1m")
-
-            # Check if we actually got data (sometimes Yahoo Finance has issues)
-            if data.empty or len(data) < 2:
-                # Not enough data points to compare
-                return {
-                    'price': None,
-                    'direction': 'NEUTRAL',
-                    'previous_price': None,
-                    'change': 0,
-                    'error': f'Insufficient data for {symbol}'
-                }
-
-            # Get the current (latest) price - the last row of data
-            current_price = data['Close'].iloc[-1]
-
-            # Get the previous price - the second to last row of data
-            previous_price = data['Close'].iloc[-2]
-
-            # Calculate the change (difference between current and previous)
-            change = current_price - previous_price
-
-            # Determine the direction (UP, DOWN, or NEUTRAL)
-            if current_price > previous_price:
-                direction = 'UP'
-            elif current_price < previous_price:
-                direction = 'DOWN'
-            else:
-                direction = 'NEUTRAL'
+        now = datetime.now(MARKET_TZ)
+        saved = self._closed_price(symbol, now)
+        if saved is not None:
+            return saved
 
-            # Return all the information in a dictionary
-            return {
-                'price': float(current_price),
-                'direction': direction,
-                'previous_price': float(previous_price),
-                'change': float(change),
-                'error': None
-            }
+        if self._cooling_down(symbol):
+            return _price_error(f'Rate limited, retrying {symbol} soon')
 
-        except Exception as e:
-            # If something goes wrong (network error, stock doesn't exist, etc.)
-            # Return an error message instead of crashing
-            return {
-                'price': None,
-                'direction': 'NEUTRAL',
-                'previous_price': None,
-                'change': 0,
-                'error': f'Error fetching {symbol}: {str(e)}'
-            }
+        data = self._minute_history(symbol)
+
+        # Check if we actually got data (sometimes Yahoo Finance has issues)
+        if data is None:
+            return _price_error(f'Error fetching {symbol}')
+
+        # Only the closing prices are needed, as a plain numpy array
+        # (reading a numpy array is much cheaper than indexing a pandas DataFrame)
+        closes = data['Close'].to_numpy(copy=False)
+        if closes.size < 2:
+            # Not enough data points to compare
+            return _price_error(f'Insufficient data for {symbol}')
+
+        # Get the current (latest) price - the last minute of data
+        current_price = float(closes[-1])
+
+        # Get the previous price - the second to last minute of data
+        previous_price = float(closes[-2])
+
+        # The previous trading day's close, for change_pct
+        session = _session_date(data.index[-1])
+        previous_close = self._previous_closes({symbol: session}).get(symbol)
+
+        # Save it until the market opens if it's closed, then return it
+        result = _price_result(current_price, previous_price, previous_close)
+        self._save_closed_price(symbol, result, now)
+        return result
+
+    # ================================================================================================
+    # METHOD: Fetch Intraday Chart Data (async)
+    # ================================================================================================
+    async def fetch_intraday(self, symbol):
+        """
+        Run get_intraday_data() in a worker thread without blocking the event loop.
+
+        Parameters:
+            symbol (str): The stock ticker symbol (e.g., "AAPL")
+
+        Returns:
+            pandas.DataFrame: Same as get_intraday_data()
+
+        The result is stored in the same caches as get_intraday_data(), so this is
+        used to load a chart in the background before the user opens it.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get_intraday_data, symbol)
 
     # ================================================================================================
     # METHOD: Get Intraday Chart Data
@@ -121,6 +1185,23 @@ class StockDataManager:
         """
         Get minute-by-minute stock data for today (for charting).
 
+        Parameters:
+            symbol (str): The stock ticker symbol (e.g., "AAPL")
+
+        Returns:
+            pandas.DataFrame: A dataframe with timestamps and prices for each minute
+                             or None if an error occurred
+        """
+        return self._minute_history(symbol)
+
+    # ================================================================================================
+    # METHOD: Get Today's Minute History
+    # ================================================================================================
+    @ttl_cache(QUOTE_TTL_S)
+    def _minute_history(self, symbol):
+        """
+        Download (or reuse) today's 1-minute prices for a stock.
+
         Parameters:
             symbol (str): The stock ticker symbol (e.g., "AAPL")
 
@@ -128,33 +1209,107 @@ class StockDataManager:
             pandas.DataFrame: A dataframe with timestamps and prices for each minute
                              or None if an error occurred
 
+        Both the price readout (_fetch_price) and the chart (get_intraday_data) use this,
+        so they share one download and the cached result. The cache time is QUOTE_TTL_S,
+        the shorter of the two, so the price is never older than it used to be.
+
         How it works:
-            1. Fetch 1-minute interval data for today
-            2. Return the raw data for the chart to plot
+            1. Look for today's data in the file cache (saved by an earlier fetch or app run)
+            2. If found, only fetch the minutes newer than the last saved one and add them
+               Otherwise, fetch 1-minute interval data for today
+            3. Keep only the latest session's minutes and save them to that day's cache file
+            4. Return the data for the chart to plot
         """
+        if self._cooling_down(symbol):
+            return None
+
         try:
-            # Create a Ticker object
-            ticker = yf.Ticker(symbol)
+            # Get the Ticker object
+            ticker = self._ticker(symbol)
+
+            # Each trading day's data is stored in its own cache file
+            # (the day is the one in New York, where the market is, not the user's own date)
+            # Look for today's file - it only exists once today's session has started
+            interval = "1m"
+            market_date = datetime.now(MARKET_TZ).date()
+            cache_key = f"{symbol}_{interval}_{market_date.isoformat()}"
+            cached = self.file_cache.get(cache_key)
 
-            # Get 1-minute interval data for today
-            # This returns a dataframe with columns: Open, High, Low, Close, Volume
-            data = ticker.history(period="1d", interval="1m")
+            if cached is not None and not cached.empty:
+                # We already have part of today - only download the newer minutes
+                last_ts = cached.index.max()
+                new_data = ticker.history(start=last_ts, interval=interval)
+
+                # Combine old and new rows, keeping the newest copy of any repeated minute
+                import pandas as pd
+                data = pd.concat([cached, new_data])
+                data = data[~data.index.duplicated(keep='last')].sort_index()
+            else:
+                # Get 1-minute interval data for today
+                # This returns a dataframe with columns: Open, High, Low, Close, Volume
+                data = ticker.history(period="1d", interval=interval)
 
             # Check if we got any data
             if data.empty:
                 return None
 
+            # Keep only the minutes of the latest trading session
+            # Before the market opens, period="1d" gives the previous session's minutes, so a
+            # cache file could otherwise hold two days - and the chart would show both price ranges
+            session = _session_date(data.index.max())
+            data = data[data.index.tz_convert(MARKET_TZ).date == session]
+
+            # Save for next time, under the day the minutes are from
+            # (finished trading days can be kept much longer)
+            if session == market_date:
+                ttl = RECENT_FILE_TTL_S
+            else:
+                ttl = HISTORY_FILE_TTL_S
+            self.file_cache.set(f"{symbol}_{interval}_{session.isoformat()}", data, ttl)
+
             # Return the dataframe (it has timestamps as index and Close prices as a column)
             return data
 
-        except Exception as e:
+        except _fetch_errors() as e:
             # If something goes wrong, return None
-            print(f"Error fetching intraday data for {symbol}: {str(e)}")
+            self._note_error(symbol, e)
+            logger.warning("Error fetching intraday data for %s: %s", symbol, e)
             return None
 
+    # ================================================================================================
+    # METHOD: Fetch Stock Information (async)
+    # ================================================================================================
+    async def fetch_info(self, symbol):
+        """
+        Run get_stock_info() in a worker thread without blocking the event loop.
+
+        Parameters:
+            symbol (str): The stock ticker symbol (e.g., "AAPL")
+
+        Returns:
+            dict: Same as get_stock_info()
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get_stock_info, symbol)
+
+    # ================================================================================================
+    # METHOD: Prefetch a Stock's Detail Data (async)
+    # ================================================================================================
+    async def prefetch(self, symbol):
+        """
+        Load everything the detail view needs for a stock, both downloads at the same time.
+
+        Parameters:
+            symbol (str): The stock ticker symbol (e.g., "AAPL")
+
+        The results end up in the caches, so opening the stock afterwards doesn't wait.
+        """
+        await asyncio.gather(self.fetch_intraday(symbol), self.fetch_info(symbol))
+
     # ================================================================================================
     # METHOD: Get Stock Information (Market Cap, P/E Ratio, etc.)
     # ================================================================================================
+    @ttl_cache(INFO_TTL_S)
     def get_stock_info(self, symbol):
         """
         Get detailed information about a stock (market cap, P/E ratio, etc.).
@@ -163,98 +1318,71 @@ class StockDataManager:
             symbol (str): The stock ticker symbol (e.g., "AAPL")
 
         Returns:
-            dict: A dictionary containing:
-                - 'market_cap': Market capitalization (e.g., "2.8 Trillion")
-                - 'pe_ratio': Price to Earnings ratio (e.g., "28.5")
-                - 'dividend_yield': Dividend yield (e.g., "0.42%")
-                - '52_week_high': Highest price in last 52 weeks
-                - '52_week_low': Lowest price in last 52 weeks
-                - 'day_high': Highest price today
-                - 'day_low': Lowest price today
-                - 'error': Error message if something went wrong (or None if successful)
+            StockInfoResult: The market cap, P/E ratio, dividend yield, 52-week and
+                             day high/low, or "N/A" everywhere and the error if something went wrong
 
         How it works:
-            1. Create a Ticker object
-            2. Access the .info attribute which has company information
-            3. Extract specific fields and format them nicely
-            4. Return all the information in a dictionary
+            1. Return the saved information if it's in the disk cache
+            2. Otherwise create a Ticker object
+            3. Read the prices and market cap from .fast_info (one quick quote request)
+            4. Read the P/E ratio and dividend yield from .get_info() (the slow full
+               company information - fast_info doesn't have them)
+            5. Format everything nicely
+            6. Save the result to the disk cache and return it
         """
+        # Information saved by an earlier run of the app (diskcache removes it after INFO_TTL_S)
+        cache_key = f"info:{symbol}"
+        # (anything else saved under this key is from an older version of the app, and ignored)
+        cached = self.disk.get(cache_key)
+        if isinstance(cached, StockInfoResult):
+            return cached
+
+        if self._cooling_down(symbol):
+            return _info_error(f'Rate limited, retrying {symbol} info soon')
+
         try:
-            # Create a Ticker object
-            ticker = yf.Ticker(symbol)
+            # Get the Ticker object
+            ticker = self._ticker(symbol)
 
-            # Get the info dictionary - this contains lots of company information
-            info = ticker.info
+            # fast_info comes from a small quote request and has most of what we show
+            fast = ticker.fast_info
 
-            # Helper function to format large numbers nicely
-            # e.g., 2800000000000 becomes "2.8T" (2.8 Trillion)
-            def format_number(value):
-                if value is None:
-                    return "N/A"
-                if isinstance(value, str):
-                    return value
-
-                value = float(value)
-
-                # If it's over a trillion
-                if abs(value) >= 1_000_000_000_000:
-                    return f"${value / 1_000_000_000_000:.2f}T"
-                # If it's over a billion
-                elif abs(value) >= 1_000_000_000:
-                    return f"${value / 1_000_000_000:.2f}B"
-                # If it's over a million
-                elif abs(value) >= 1_000_000:
-                    return f"${value / 1_000_000:.2f}M"
-                # Otherwise just show it as is
-                else:
-                    return f"${value:.2f}"
-
-            # Extract specific fields from the info dictionary
-            # Use .get() so it returns "N/A" if the field doesn't exist
-
-            market_cap = info.get('marketCap', 0)
-            market_cap_str = format_number(market_cap) if market_cap else "N/A"
-
-            pe_ratio = info.get('trailingPE', None)
-            pe_ratio_str = f"{pe_ratio:.2f}" if pe_ratio else "N/A"
-
-            dividend_yield = info.get('dividendYield', None)
-            dividend_str = f"{dividend_yield * 100:.2f}%" if dividend_yield else "N/A"
-
-            week_52_high = info.get('fiftyTwoWeekHigh', None)
-            week_52_high_str = f"${week_52_high:.2f}" if week_52_high else "N/A"
-
-            week_52_low = info.get('fiftyTwoWeekLow', None)
-            week_52_low_str = f"${week_52_low:.2f}" if week_52_low else "N/A"
-
-            day_high = info.get('dayHigh', None)
-            day_high_str = f"${day_high:.2f}" if day_high else "N/A"
-
-            day_low = info.get('dayLow', None)
-            day_low_str = f"${day_low:.2f}" if day_low else "N/A"
-
-            # Return all information in a dictionary
-            return {
-                'market_cap': market_cap_str,
-                'pe_ratio': pe_ratio_str,
-                'dividend_yield': dividend_str,
-                '52_week_high': week_52_high_str,
-                '52_week_low': week_52_low_str,
-                'day_high': day_high_str,
-                'day_low': day_low_str,
-                'error': None
-            }
+            # The 52-week and day high/low prices
+            fields = {field: _money_or_na(getattr(fast, source)) for field, source in _MONEY_FIELDS}
 
-        except Exception as e:
+            market_cap = fast.market_cap
+            fields['market_cap'] = _format_money(market_cap) if market_cap else "N/A"
+
+            # The P/E ratio and dividend yield are only in the full info dictionary,
+            # which is a much slower request - if it fails, the rest is still shown
+            # (with an error, so it isn't cached and the next call tries again)
+            error = None
+            try:
+                info = ticker.get_info()
+            except (*_fetch_errors(), KeyError) as e:
+                self._note_error(symbol, e)
+                logger.warning("Error fetching P/E ratio and dividend yield for %s: %s", symbol, e)
+                info = {}
+                error = f'Error fetching {symbol} P/E ratio and dividend yield'
+
+            # Read every field from the dictionary in one pass
+            # (.get() gives None, shown as "N/A", if a field doesn't exist)
+            pe_ratio, dividend_yield = [info.get(key) for key in _INFO_KEYS]
+            fields['pe_ratio'] = f"{pe_ratio:.2f}" if pe_ratio else "N/A"
+            fields['dividend_yield'] = f"{dividend_yield * 100:.2f}%" if dividend_yield else "N/A"
+
+            # Put all information in one result
+            result = StockInfoResult(**fields, error=error)
+
+            # Save it for next time (errors are never saved, so they're retried)
+            if error is None:
+                self.disk.set(cache_key, result, expire=INFO_TTL_S)
+            return result
+
+        except (*_fetch_errors(), KeyError) as e:
             # If something goes wrong, return error information
-            print(f"Error fetching info for {symbol}: {str(e)}")
-            return {
-                'market_cap': "N/A",
-                'pe_ratio': "N/A",
-                'dividend_yield': "N/A",
-                '52_week_high': "N/A",
-                '52_week_low': "N/A",
-                'day_high': "N/A",
-                'day_low': "N/A",
-                'error': f'Error fetching {symbol} info'
-            }
+            # (yfinance raises KeyError from inside fast_info and get_info() when part of Yahoo's
+            # answer is missing, e.g. 'currentTradingPeriod' when the request failed)
+            self._note_error(symbol, e)
+            logger.warning("Error fetching info for %s: %s", symbol, e)
+            return _info_error(f'Error fetching {symbol} info')